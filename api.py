@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Dict, List, Union
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+import calibration
+import explanations
+import inference
+from batching import BatchScheduler
+from model_registry import ModelLoadError, get_registry
+from prediction_cache import PredictionCache
+
+
+# Headless inference service for EHR integrations:
+#   uvicorn api:app --host 0.0.0.0 --port 8000 --workers 4
+WORKERS = int(os.environ.get("INFERENCE_WORKERS", os.cpu_count() or 1))
+
+logger = logging.getLogger(__name__)
+
+Record = Union[List[Union[float, str]], Dict[str, Union[float, str]]]
+
+model_registry = get_registry()
+executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="inference")
+scheduler = BatchScheduler(model_registry, executor=executor, cache=PredictionCache())
+
+
+class PredictRequest(BaseModel):
+    features: Record
+
+
+class BatchPredictRequest(BaseModel):
+    records: List[Record]
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Load every model and start one micro-batcher per disease before serving traffic
+    loop = asyncio.get_running_loop()
+    for key in inference.DISEASES:
+        try:
+            await loop.run_in_executor(executor, scheduler.batcher, key)
+        except ModelLoadError as e:
+            # Served once the model file appears; the registry retries it
+            logger.warning("Starting without %s: %s", key, e)
+    yield
+    model_registry.close()
+    scheduler.close()
+    executor.shutdown(wait=True)
+
+
+app = FastAPI(title="Health & Wellness Inference API", lifespan=lifespan)
+
+
+def _model_key(disease):
+    key = inference.disease_key(disease)
+    if key not in inference.DISEASES:
+        raise HTTPException(status_code=404, detail=f"Unknown disease: {disease}")
+    return key
+
+
+def _matrix(key, records):
+    try:
+        return inference.records_to_matrix(key, records)
+    except inference.SchemaError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _unavailable(key, error):
+    # A model that can't be loaded yet answers 503; the registry keeps retrying it
+    detail = error.args[0] if error.args and error.args[0] else f"{inference.DISEASES[key]['label']} model unavailable"
+    return HTTPException(status_code=503, detail=detail)
+
+
+async def _on_model(key, fn, *args):
+    # On the worker pool: the first call may load the model from disk
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+    except ModelLoadError as e:
+        raise _unavailable(key, e)
+
+
+def _submit(key, record, explain):
+    # Encode and queue one record; the future resolves once its micro-batch is scored
+    return scheduler.submit(key, _matrix(key, [record])[0], explain)
+
+
+def _score_batch(key, records, explain):
+    # Model and version are read together: the whole batch is scored by one version, even if a
+    # new one is swapped in meanwhile
+    matrix = _matrix(key, records)
+    if explain:
+        return explanations.explain(key, matrix, model_registry)
+    model, version = model_registry.current(key)
+    if model is None:
+        raise ModelLoadError(model_registry.error(key))
+    return inference.risk_scores(key, model, matrix), None, version
+
+
+def _result(key, risk, calibrator, version, contribs=None):
+    # version is the model that produced this result; models are hot-swapped when Models/ changes
+    result = {
+        "disease": key,
+        "risk_score": float(risk),
+        "threshold": calibrator.threshold,
+        "prediction": int(risk >= calibrator.threshold),
+        "calibration": calibrator.method,
+        "model_version": version.get("version"),
+        "model_sha256": version.get("sha256"),
+    }
+    if contribs is not None:
+        # Per-feature TreeSHAP contributions in log-odds, plus the model's bias term
+        result["contributions"] = dict(zip(inference.DISEASES[key]["features"], map(float, contribs[:-1])))
+        result["bias"] = float(contribs[-1])
+    return result
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "models": sorted(scheduler.stats())}
+
+
+@app.get("/models")
+async def models():
+    # Version, content hash, load time and reload count of every loaded model
+    return {"models": model_registry.stats(), "errors": {key: model_registry.error(key)
+                                                         for key in inference.DISEASES if model_registry.error(key)}}
+
+
+@app.get("/metrics")
+async def metrics():
+    # Per-model p50/p99 latency and batch-size histogram, for tuning the batching window
+    return {
+        "max_wait_ms": scheduler.max_wait_ms,
+        "max_batch_size": scheduler.max_batch_size,
+        "models": scheduler.stats(),
+        "explained": scheduler.stats(explain=True),
+        "prediction_cache": scheduler.cache.stats(),
+    }
+
+
+@app.post("/predict/{disease}")
+async def predict(disease: str, request: PredictRequest, explain: bool = False):
+    key = _model_key(disease)
+    calibrator = calibration.get_calibrator(key)
+    # Encoding runs on the worker pool with the inference, keeping the event loop free
+    future = await _on_model(key, _submit, key, request.features, explain)
+    try:
+        value, version = await asyncio.wrap_future(future)
+    except ModelLoadError as e:
+        raise _unavailable(key, e)
+    if explain:
+        # Explained requests are batched too; the contributions also give the probability
+        return _result(key, calibrator(explanations.probabilities([value]))[0], calibrator, version, value)
+    return _result(key, value, calibrator, version)
+
+
+@app.post("/predict/{disease}/batch")
+async def predict_batch(disease: str, request: BatchPredictRequest, explain: bool = False):
+    key = _model_key(disease)
+    # Already a batch: encode and score (and explain) it in one call on the worker pool
+    calibrator = calibration.get_calibrator(key)
+    risks, contribs, version = await _on_model(key, _score_batch, key, request.records, explain)
+    if contribs is None:
+        results = [_result(key, risk, calibrator, version) for risk in risks]
+    else:
+        results = [_result(key, r, calibrator, version, c) for r, c in zip(risks, contribs)]
+    return {"disease": key, "results": results}
+
+
+@app.get("/explain/{disease}/importance")
+async def importance(disease: str):
+    # Mean |contribution| per feature over the training dataset; cached per model version
+    key = _model_key(disease)
+    series = await _on_model(key, explanations.global_importance, key, model_registry)
+    return {"disease": key, "importance": series.to_dict()}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("api:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)))
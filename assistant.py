@@ -0,0 +1,89 @@
+import os
+import threading
+import time
+
+
+# LLM backends for the AI Assistant page. Each backend streams the answer as text chunks.
+#   gemini - Google Gemini (default); one configured client per process
+#   http   - any server streaming plain-text chunks for a POSTed prompt, e.g. the local
+#            stub in benchmarks/llm_stub_server.py used for tests and benchmarks
+LLM_BACKEND = os.environ.get("HEALTHAPP_LLM_BACKEND", "gemini")
+LLM_URL = os.environ.get("HEALTHAPP_LLM_URL", "http://127.0.0.1:8765/generate")
+GEMINI_MODEL = "gemini-1.5-pro"
+GEMINI_EMBEDDING_MODEL = "models/text-embedding-004"
+
+
+class GeminiBackend:
+    name = "gemini"
+
+    def __init__(self, api_key, model_name=GEMINI_MODEL):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.genai = genai
+        self.model = genai.GenerativeModel(model_name)
+
+    def stream(self, prompt):
+        for chunk in self.model.generate_content(prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+
+    def embed(self, text):
+        # Used by the response cache's optional similarity lookup
+        return self.genai.embed_content(model=GEMINI_EMBEDDING_MODEL, content=text)["embedding"]
+
+
+class HttpBackend:
+    name = "http"
+
+    def __init__(self, url=LLM_URL, timeout=60):
+        import requests
+
+        self.url = url
+        self.timeout = timeout
+        # Keep-alive connections are reused across messages
+        self.session = requests.Session()
+
+    def stream(self, prompt):
+        with self.session.post(self.url, json={"prompt": prompt}, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            response.encoding = response.encoding or "utf-8"
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                if chunk:
+                    yield chunk
+
+
+class TimedStream:
+    """Wraps a chunk stream and records time to first token and total latency."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.text = ""
+        self.first_token_s = None
+        self.total_s = None
+
+    def __iter__(self):
+        start = time.perf_counter()
+        for chunk in self._chunks:
+            if self.first_token_s is None:
+                self.first_token_s = time.perf_counter() - start
+            self.text += chunk
+            yield chunk
+        self.total_s = time.perf_counter() - start
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend(api_key=None):
+    # One client per process, shared by every chat session
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if LLM_BACKEND == "http":
+                    _backend = HttpBackend()
+                else:
+                    _backend = GeminiBackend(api_key)
+    return _backend
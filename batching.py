@@ -0,0 +1,265 @@
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+import calibration
+import inference
+from model_registry import ModelLoadError
+
+
+# Defaults for the batching window; tune per deployment without code changes
+BATCH_WAIT_MS = float(os.environ.get("INFERENCE_BATCH_WAIT_MS", 5))
+MAX_BATCH_SIZE = int(os.environ.get("INFERENCE_MAX_BATCH_SIZE", 256))
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+
+class BatchStats:
+    """Latency and batch-size figures for tuning the batching window."""
+
+    def __init__(self, window=10_000):
+        self._latencies = deque(maxlen=window)
+        self._batch_sizes = Counter()
+        self._requests = 0
+        self._batches = 0
+        self._lock = threading.Lock()
+
+    def record(self, batch_size, latencies):
+        # Histogram buckets are powers of two: 1, 2, 4, 8, ...
+        bucket = 1 << (batch_size - 1).bit_length()
+        with self._lock:
+            self._batches += 1
+            self._requests += batch_size
+            self._batch_sizes[bucket] += 1
+            self._latencies.extend(latencies)
+
+    def snapshot(self):
+        with self._lock:
+            latencies = list(self._latencies)
+            histogram = dict(sorted(self._batch_sizes.items()))
+            requests, batches = self._requests, self._batches
+        return {
+            "requests": requests,
+            "batches": batches,
+            "mean_batch_size": requests / batches if batches else 0.0,
+            "latency_p50_ms": _percentile(latencies, 50) * 1000,
+            "latency_p99_ms": _percentile(latencies, 99) * 1000,
+            "batch_size_histogram": {f"<={size}": count for size, count in histogram.items()},
+        }
+
+
+class MicroBatcher:
+    """Collects single-row prediction requests for one model and scores them as one matrix."""
+
+    def __init__(self, predict_fn, max_wait_ms=BATCH_WAIT_MS, max_batch_size=MAX_BATCH_SIZE, executor=None):
+        self.predict_fn = predict_fn
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self.stats = BatchStats()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._collect, daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        """Queue one feature row; the returned future resolves to that row's prediction."""
+        future = Future()
+        self._queue.put((np.asarray(row, dtype=np.float32), future, time.perf_counter()))
+        return future
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _collect(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            # Keep collecting until the window closes or the batch is full
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            if self.executor is not None:
+                self.executor.submit(self._run, batch)
+            else:
+                self._run(batch)
+            if stop:
+                return
+
+    def _run(self, batch):
+        # Claim every future first: rows whose caller cancelled them are dropped, and claimed
+        # futures can no longer be cancelled while the batch is scored
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self.predict_fn(np.vstack([row for row, _, _ in batch]))
+        except Exception as e:
+            for _, future, _ in batch:
+                self._deliver(future.set_exception, e)
+            return
+
+        done = time.perf_counter()
+        for (_, future, _), result in zip(batch, results):
+            self._deliver(future.set_result, result)
+        self.stats.record(len(batch), [done - submitted for _, _, submitted in batch])
+
+    @staticmethod
+    def _deliver(resolve, value):
+        # One future that can't take its result must not strand the rest of the batch, or kill
+        # the collector thread when there is no executor
+        try:
+            resolve(value)
+        except Exception:
+            logger.exception("Could not deliver a batched prediction")
+
+
+class BatchScheduler:
+    """One micro-batcher per disease model, shared by every caller in the process."""
+
+    def __init__(self, registry, max_wait_ms=BATCH_WAIT_MS, max_batch_size=MAX_BATCH_SIZE, executor=None,
+                 cache=None):
+        self.registry = registry
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        # Optional PredictionCache; repeated rows are answered without queueing for a batch
+        self.cache = cache
+        self._batchers = {}
+        self._explainers = {}
+        self._lock = threading.Lock()
+
+    def batcher(self, key):
+        if key not in self._batchers:
+            with self._lock:
+                if key not in self._batchers:
+                    if self.registry.get(key) is None:
+                        raise ModelLoadError(self.registry.error(key))
+                    self._batchers[key] = MicroBatcher(
+                        lambda X, key=key: self._score(key, X),
+                        max_wait_ms=self.max_wait_ms, max_batch_size=self.max_batch_size, executor=self.executor
+                    )
+        return self._batchers[key]
+
+    def _score(self, key, X):
+        # The model is looked up per batch, so a hot-reloaded version is used from the next batch
+        # on while the running one finishes on the old; its version is read in the same step
+        model, version = self.registry.current(key)
+        if model is None:
+            raise ModelLoadError(self.registry.error(key))
+        return [(risk, version) for risk in inference.risk_scores(key, model, X)]
+
+    def explainer(self, key):
+        # Batches TreeSHAP requests; each result is one row of contributions (+ bias)
+        if key not in self._explainers:
+            import explanations
+
+            with self._lock:
+                if key not in self._explainers:
+                    explanations.get_booster(key, self.registry)
+                    self._explainers[key] = MicroBatcher(
+                        lambda X, key=key: self._explain(key, X),
+                        max_wait_ms=self.max_wait_ms, max_batch_size=self.max_batch_size, executor=self.executor
+                    )
+        return self._explainers[key]
+
+    def _explain(self, key, X):
+        import explanations
+
+        contribs, version = explanations.versioned_contributions(key, X, self.registry)
+        return [(row, version) for row in contribs]
+
+    def submit(self, key, row, explain=False):
+        """Queue one row; the future resolves to (risk score or contributions, version of the model used)."""
+        batcher = self.explainer(key) if explain else self.batcher(key)
+        if self.cache is None:
+            return batcher.submit(row)
+
+        # Contributions depend only on the model; risk scores also on its calibration. A hit is
+        # reported with the version it was looked up under, a fresh result with the one that scored it
+        model_version = self.registry.version(key)
+        suffix = "" if explain else f":{calibration.get_calibrator(key).version}"
+        cache_key = self.cache.key(key, "explain" if explain else "risk", row)
+        cached = self.cache.get(cache_key, f"{model_version.get('sha256')}{suffix}")
+        if cached is not None:
+            future = Future()
+            future.set_result((cached, model_version))
+            return future
+
+        def remember(done):
+            if done.exception() is None:
+                value, used = done.result()
+                self.cache.put(cache_key, f"{used.get('sha256')}{suffix}", value)
+
+        future = batcher.submit(row)
+        future.add_done_callback(remember)
+        return future
+
+    def configure(self, max_wait_ms=None, max_batch_size=None):
+        # Applies to running batchers too; takes effect from their next batch
+        if max_wait_ms is not None:
+            self.max_wait_ms = max_wait_ms
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        for batcher in [*self._batchers.values(), *self._explainers.values()]:
+            batcher.max_wait_ms = self.max_wait_ms
+            batcher.max_batch_size = self.max_batch_size
+
+    def stats(self, explain=False):
+        batchers = self._explainers if explain else self._batchers
+        return {key: batcher.stats.snapshot() for key, batcher in batchers.items()}
+
+    def close(self):
+        for batcher in [*self._batchers.values(), *self._explainers.values()]:
+            batcher.close()
+        self._batchers.clear()
+        self._explainers.clear()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    # Process-wide, like the model registry, so concurrent sessions share batches
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                from model_registry import get_registry
+                from prediction_cache import PredictionCache
+
+                _scheduler = BatchScheduler(get_registry(), cache=PredictionCache())
+    return _scheduler
@@ -0,0 +1,37 @@
+import argparse
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assistant import HttpBackend, LLM_URL, TimedStream
+
+
+# Time to first token and total latency of the assistant backend, against the local stub:
+#   python benchmarks/llm_stub_server.py &
+#   python benchmarks/assistant_latency.py --requests 20
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark assistant streaming latency")
+    parser.add_argument("--url", default=LLM_URL)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--prompt", default="How much water should I drink?")
+    args = parser.parse_args()
+
+    backend = HttpBackend(args.url)
+    first_token, total = [], []
+    for _ in range(args.requests):
+        stream = TimedStream(backend.stream(args.prompt))
+        for _ in stream:
+            pass
+        first_token.append(stream.first_token_s)
+        total.append(stream.total_s)
+
+    print(f"time to first token: median {statistics.median(first_token) * 1000:.1f} ms, "
+          f"max {max(first_token) * 1000:.1f} ms")
+    print(f"total latency:       median {statistics.median(total) * 1000:.1f} ms, "
+          f"max {max(total) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
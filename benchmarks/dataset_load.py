@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import datasets
+import inference
+
+
+# Load time of each training dataset: pd.read_csv alone, the full CSV parse-and-encode path
+# the cache replaces, and the memory-mapped Arrow copy (cold open, then in-process reuse):
+#   python benchmarks/dataset_load.py --repeats 20
+
+
+def best_seconds(fn, repeats):
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return min(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark typed Arrow dataset loads against pd.read_csv")
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    results = []
+    for key, spec in inference.DISEASES.items():
+        if not datasets.is_fresh(key):
+            datasets.convert(key)
+
+        def cold_load():
+            datasets._tables.pop(key, None)
+            return datasets.load(key)
+
+        def read_csv():
+            return pd.read_csv(spec["dataset"], encoding="utf-8-sig")
+
+        results.append({
+            "model": key,
+            "rows": datasets.load_table(key).num_rows,
+            "csv_kb": os.path.getsize(spec["dataset"]) / 1024,
+            "arrow_kb": os.path.getsize(datasets.cache_path(key)) / 1024,
+            "read_csv_ms": best_seconds(read_csv, args.repeats) * 1000,
+            "csv_typed_ms": best_seconds(lambda: datasets.read_csv(key), args.repeats) * 1000,
+            "arrow_cold_ms": best_seconds(cold_load, args.repeats) * 1000,
+            "arrow_warm_ms": best_seconds(lambda: datasets.load(key), args.repeats) * 1000,
+        })
+
+    df = pd.DataFrame(results).set_index("model")
+    df["speedup_vs_read_csv"] = df["read_csv_ms"] / df["arrow_cold_ms"]
+    print(df.to_string(float_format=lambda v: f"{v:.3g}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import datasets
+import explanations
+import inference
+from model_registry import get_registry
+
+
+# TreeSHAP explanation latency per row, one row at a time (the UI path) and in batches
+# (the API's batch path), next to the plain prediction it replaces; also checks that the
+# contributions reproduce predict_proba and times the cached global importance:
+#   python benchmarks/explanations.py --batch-rows 10000
+TOLERANCE = 1e-5
+
+
+def per_call_seconds(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TreeSHAP explanations")
+    parser.add_argument("--repeats", type=int, default=200, help="single-row calls per model")
+    parser.add_argument("--batch-rows", type=int, default=10_000, help="rows per batch call (dataset is tiled)")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    registry = get_registry()
+    results = []
+    for key in inference.DISEASES:
+        model = registry.get(key)
+        if model is None:
+            print(f"{key}: skipped ({registry.error(key)})")
+            continue
+        X = datasets.matrix(key)
+        batch = np.resize(X, (args.batch_rows, X.shape[1]))
+        row = X[:1]
+
+        contribs = explanations.contributions(key, X, registry)
+        max_error = float(np.abs(explanations.probabilities(contribs) - inference.predict_proba(model, X)).max())
+        if max_error > TOLERANCE:
+            raise SystemExit(f"{key}: contributions disagree with predict_proba (max |error| {max_error:.2e})")
+
+        # Global importance: first call computes (or reads the disk cache), later calls hit memory
+        explanations._importance.pop(key, None)
+        start = time.perf_counter()
+        explanations.global_importance(key, registry)
+        importance_cold_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        explanations.global_importance(key, registry)
+        importance_warm_us = (time.perf_counter() - start) * 1e6
+
+        results.append({
+            "model": key,
+            "features": X.shape[1],
+            "max_abs_error": max_error,
+            "predict_row_us": per_call_seconds(lambda: inference.predict_proba(model, row), args.repeats) * 1e6,
+            "explain_row_us": per_call_seconds(lambda: explanations.explain(key, row, registry), args.repeats) * 1e6,
+            "predict_batch_us_per_row": per_call_seconds(lambda: inference.predict_proba(model, batch), 3)
+                                        / len(batch) * 1e6,
+            "explain_batch_us_per_row": per_call_seconds(lambda: explanations.explain(key, batch, registry), 3)
+                                        / len(batch) * 1e6,
+            "importance_cold_ms": importance_cold_ms,
+            "importance_warm_us": importance_warm_us,
+        })
+
+    df = pd.DataFrame(results).set_index("model")
+    df["batch_speedup"] = df["explain_row_us"] / df["explain_batch_us_per_row"]
+    print(df.to_string(float_format=lambda v: f"{v:.3g}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import inference
+import train
+
+
+# Fits, wall-clock time and accuracy of each train.py search mode on the same split, next to
+# the notebooks' staged grid. Nothing is saved:
+#   python benchmarks/hyperparameter_search.py --searches grid halving tpe
+# Exits 1 if a joint search ends below the grid's CV accuracy for any model.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hyperparameter search modes against the staged grid")
+    parser.add_argument("models", nargs="*", help="models to tune (default: all)")
+    parser.add_argument("--searches", nargs="+", default=list(train.SEARCHES), choices=sorted(train.SEARCHES))
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    from sklearn.metrics import accuracy_score
+
+    searches = ["grid"] + [s for s in args.searches if s != "grid"]
+    results = []
+    for key in args.models or inference.DISEASES:
+        X_train, X_test, y_train, y_test = train.split(key)
+        for search in searches:
+            start = time.perf_counter()
+            model, _, cv_accuracy, fits = train.SEARCHES[search](X_train, y_train, args.n_jobs)
+            results.append({
+                "model": key,
+                "search": search,
+                "fits": fits,
+                "wall_clock_s": time.perf_counter() - start,
+                "cv_accuracy": cv_accuracy,
+                "test_accuracy": accuracy_score(y_test, model.predict(X_test)),
+            })
+
+    df = pd.DataFrame(results).set_index(["model", "search"])
+    # The grid's row for each model, aligned with every row of the table
+    grid = df.xs("grid", level="search").reindex(df.index.get_level_values("model")).set_index(df.index)
+    df["fits_vs_grid"] = df["fits"] / grid["fits"]
+    df["time_vs_grid"] = df["wall_clock_s"] / grid["wall_clock_s"]
+    df["cv_vs_grid"] = df["cv_accuracy"] - grid["cv_accuracy"]
+    print(df.to_string(float_format=lambda v: f"{v:.4g}"))
+
+    behind = df[df["cv_vs_grid"] < 0]
+    if not behind.empty:
+        print("\nBelow the grid's CV accuracy: " + ", ".join(f"{m}/{s}" for m, s in behind.index))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import router
+
+
+# Import-time profile of app.py, built on `python -X importtime`. The shell (everything imported
+# before the sidebar renders) decides time to first paint; each page then pays for its own
+# imports on its first visit. Fails if the shell import exceeds the cold-start target:
+#   python benchmarks/import_profile.py --top 10
+SHELL = ["streamlit", "streamlit_option_menu", "dotenv", "charts", "router"]
+# Imported while a page renders rather than with its module
+RENDER_IMPORTS = {
+    # joblib unpickling pulls in xgboost on the first prediction
+    "🩺 Disease Prediction": ["joblib", "xgboost"],
+    # Static charts render with seaborn/matplotlib, interactive ones with altair
+    "💪 Fitness Tracking": ["matplotlib.figure", "seaborn"],
+    "🧠 Mental Health": ["matplotlib.figure", "seaborn"],
+}
+PAGES = {page: [spec["module"]] + RENDER_IMPORTS.get(page, []) for page, spec in router.PAGES.items()}
+COLD_START_TARGET_MS = 1500
+MARKER = "--- page imports ---"
+
+
+def profile(modules, preloaded=()):
+    """Import `modules` in a fresh interpreter after `preloaded`; returns (ms, [(ms, module), ...])."""
+    code = "".join(f"import {name}\n" for name in preloaded)
+    code += f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\n"
+    code += "".join(f"import {name}\n" for name in modules)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1])
+
+    # Lines look like "import time:   self_us | cumulative_us | <indent>module"; nesting is
+    # shown by indentation, so summing the outermost entries gives the total import cost
+    lines = out.stderr.split(MARKER + "\n", 1)[1].splitlines()
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        entries.append((len(name) - len(name.lstrip()), int(cumulative) / 1000, name.strip()))
+    if not entries:
+        return 0.0, []
+    top_level = min(indent for indent, _, _ in entries)
+    outermost = [(ms, name) for indent, ms, name in entries if indent == top_level]
+    return sum(ms for ms, _ in outermost), sorted(outermost, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of the app shell and each page")
+    parser.add_argument("--target-ms", type=float, default=COLD_START_TARGET_MS,
+                        help="cold-start budget for the shell imports (time to first paint)")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per section")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per section; the fastest is reported")
+    args = parser.parse_args()
+
+    def best(modules, preloaded=()):
+        return min((profile(modules, preloaded) for _ in range(args.repeats)), key=lambda run: run[0])
+
+    sections = [("App shell (first paint)", SHELL, ())]
+    sections += [(f"{page} (first visit)", modules, SHELL) for page, modules in PAGES.items()]
+
+    shell_ms = None
+    for title, modules, preloaded in sections:
+        try:
+            total_ms, slowest = best(modules, preloaded)
+        except RuntimeError as e:
+            print(f"{title:<40} failed: {e}")
+            continue
+        if shell_ms is None and not preloaded:
+            shell_ms = total_ms
+        print(f"{title:<40} {total_ms:8.1f} ms")
+        for ms, name in slowest[:args.top]:
+            print(f"    {name:<36} {ms:8.1f} ms")
+
+    if shell_ms is None:
+        sys.exit("Could not import the app shell")
+    status = "OK" if shell_ms <= args.target_ms else "OVER BUDGET"
+    print(f"\nCold start (shell imports): {shell_ms:.1f} ms, target {args.target_ms:.0f} ms -> {status}")
+    if shell_ms > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Stand-in for the LLM when testing or benchmarking the AI Assistant:
+#   python benchmarks/llm_stub_server.py --first-token-ms 300 --token-ms 20 &
+#   HEALTHAPP_LLM_BACKEND=http streamlit run app.py
+ANSWER = ("Staying hydrated matters: most adults need about 2 to 3 litres of fluid a day, more in hot weather "
+          "or when exercising. Drink regularly through the day and watch for signs of dehydration such as "
+          "dark urine, headaches and fatigue. Please consult a doctor for advice specific to you.")
+
+
+def make_handler(first_token_ms, token_ms):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            prompt = json.loads(body or b"{}").get("prompt", "")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            time.sleep(first_token_ms / 1000)
+            words = ANSWER.split(" ") if prompt else ["..."]
+            for i, word in enumerate(words):
+                if i:
+                    time.sleep(token_ms / 1000)
+                data = (word if i == 0 else " " + word).encode()
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, *args):
+            pass
+
+    return StubHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local streaming LLM stub")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.first_token_ms, args.token_ms))
+    print(f"LLM stub listening on http://127.0.0.1:{args.port}/generate")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import csv
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import inference
+
+
+# Local load generator for api.py:
+#   uvicorn api:app --workers 4 &
+#   python benchmarks/load_test.py --disease diabetes --requests 20000 --concurrency 64
+
+
+def sample_records(key, limit):
+    # Real patients from the training dataset, in model feature order
+    spec = inference.DISEASES[key]
+    with open(spec["dataset"], newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))[:limit]
+    records = []
+    for row in rows:
+        row = {k.strip(): v for k, v in row.items()}
+        records.append({name: _number(row[name]) for name in spec["features"]})
+    return records
+
+
+def _number(value):
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+
+def run(host, port, path, payloads, total, concurrency):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    counter = iter(range(total))
+
+    def worker():
+        # One keep-alive connection per worker thread
+        conn = http.client.HTTPConnection(host, port)
+        local = []
+        for i in counter:
+            body = payloads[i % len(payloads)]
+            start = time.perf_counter()
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            local.append(time.perf_counter() - start)
+            if response.status != 200:
+                with lock:
+                    errors[0] += 1
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return latencies, errors[0], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the inference API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--disease", default="diabetes", choices=sorted(inference.DISEASES))
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="Send records in batches of this size to /batch instead of one per request")
+    args = parser.parse_args()
+
+    records = sample_records(args.disease, 1000)
+    if args.batch_size:
+        path = f"/predict/{args.disease}/batch"
+        payloads = [json.dumps({"records": records[i:i + args.batch_size]})
+                    for i in range(0, len(records), args.batch_size)]
+    else:
+        path = f"/predict/{args.disease}"
+        payloads = [json.dumps({"features": record}) for record in records]
+
+    latencies, errors, elapsed = run(args.host, args.port, path, payloads, args.requests, args.concurrency)
+    rows = len(latencies) * (args.batch_size or 1)
+    print(f"{len(latencies)} requests ({rows} rows) in {elapsed:.2f}s, {errors} errors")
+    print(f"throughput: {len(latencies) / elapsed:,.0f} req/s, {rows / elapsed:,.0f} rows/s")
+    print(f"latency p50: {percentile(latencies, 50) * 1000:.2f} ms, "
+          f"p99: {percentile(latencies, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
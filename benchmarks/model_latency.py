@@ -0,0 +1,93 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import compiled_models
+import datasets
+import inference
+from model_registry import MODEL_PATHS
+
+
+# Compares the joblib XGBClassifier path used by app.py with the exported fast path:
+#   python compiled_models.py && python benchmarks/model_latency.py
+
+COLD_LOAD = {
+    "joblib": "import joblib; joblib.load({path!r})",
+    "native": "import compiled_models; compiled_models.BoosterModel.load({path!r})",
+}
+
+
+def cold_start_seconds(kind, path, repeats):
+    # Fresh interpreter per run so import cost is included
+    code = "import time; t = time.perf_counter(); " + COLD_LOAD[kind].format(path=path) + \
+           "; print(time.perf_counter() - t)"
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        runs.append(float(out.stdout.strip()))
+    return min(runs)
+
+
+def per_call_seconds(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def dataset_matrix(key):
+    return datasets.matrix(key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark joblib vs exported model inference")
+    parser.add_argument("--repeats", type=int, default=500)
+    parser.add_argument("--cold-repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    results = []
+    for key, source in MODEL_PATHS.items():
+        if not compiled_models.is_fresh(key, source):
+            compiled_models.export_model(key, source)
+
+        sklearn_model = joblib.load(source)
+        native_model = compiled_models.BoosterModel.load(compiled_models.compiled_path(key))
+        X = dataset_matrix(key)
+        input_data = X[0].tolist()
+        row = X[:1]
+
+        if not np.allclose(sklearn_model.predict_proba(X)[:, 1], native_model.predict_proba(X)[:, 1], atol=1e-6):
+            raise SystemExit(f"{key}: exported model disagrees with the joblib model")
+
+        results.append({
+            "model": key,
+            "cold_joblib_ms": cold_start_seconds("joblib", source, args.cold_repeats) * 1000,
+            "cold_native_ms": cold_start_seconds("native", compiled_models.compiled_path(key),
+                                                 args.cold_repeats) * 1000,
+            "row_joblib_us": per_call_seconds(lambda: sklearn_model.predict([input_data]), args.repeats) * 1e6,
+            "row_native_us": per_call_seconds(lambda: native_model.predict([input_data]), args.repeats) * 1e6,
+            # Calibrated risk score (see calibration.py) vs the plain label above
+            "row_risk_us": per_call_seconds(lambda: inference.risk_scores(key, native_model, row), args.repeats) * 1e6,
+            "batch_joblib_rows_s": len(X) / per_call_seconds(lambda: sklearn_model.predict_proba(X), 20),
+            "batch_native_rows_s": len(X) / per_call_seconds(lambda: native_model.predict_proba(X), 20),
+        })
+
+    df = pd.DataFrame(results).set_index("model")
+    df["row_speedup"] = df["row_joblib_us"] / df["row_native_us"]
+    df["cold_speedup"] = df["cold_joblib_ms"] / df["cold_native_ms"]
+    print(df.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from storage import MoodStore
+
+
+# Shows that logging a mood costs the same at 1k and at 1M stored rows:
+#   python benchmarks/mood_store.py
+MOODS = ["😊 Happy", "😞 Sad", "😰 Stressed", "😟 Anxious", "😌 Relaxed"]
+START = datetime.date(2000, 1, 1)
+
+
+def synthetic_rows(count, users, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield (f"user{rng.randrange(users)}", START + datetime.timedelta(days=rng.randrange(20_000)),
+               rng.choice(MOODS))
+
+
+def log_latencies(store, samples, seed):
+    latencies = []
+    for user, date, mood in synthetic_rows(samples, 1_000_000, seed):
+        start = time.perf_counter()
+        store.log(user, date, mood)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mood log latency as the store grows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MoodStore(os.path.join(tmp, "moods.db"))
+        previous = 0
+        print(f"{'rows':>10} {'bulk rows/s':>12} {'log p50 ms':>11} {'log p99 ms':>11}")
+        for size in sorted(args.sizes):
+            start = time.perf_counter()
+            store.bulk_import(synthetic_rows(size - previous, args.users, seed=size))
+            bulk_rate = (size - previous) / max(time.perf_counter() - start, 1e-9)
+            previous = size
+
+            latencies = sorted(log_latencies(store, args.samples, seed=-size))
+            p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+            print(f"{size:>10,} {bulk_rate:>12,.0f} {statistics.median(latencies) * 1000:>11.3f} "
+                  f"{p99 * 1000:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import datasets
+from model_registry import MODEL_PATHS
+from tree_evaluator import TreeEnsemble
+
+
+# Checks the NumPy evaluator against XGBClassifier.predict_proba on every dataset row
+# and compares batch throughput:
+#   python benchmarks/tree_evaluator.py --rows 100000
+TOLERANCE = 1e-6
+
+
+def rows_per_second(fn, X, repeats):
+    fn(X[:10])
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(X)
+    return len(X) * repeats / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate and benchmark the NumPy tree evaluator")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per throughput run (dataset is tiled)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    results = []
+    for key, source in MODEL_PATHS.items():
+        model = joblib.load(source)
+        ensemble = TreeEnsemble.from_booster(model.get_booster())
+        X = datasets.matrix(key)
+
+        max_error = float(np.abs(model.predict_proba(X)[:, 1] - ensemble.predict_proba(X)[:, 1]).max())
+        if max_error > TOLERANCE:
+            raise SystemExit(f"{key}: max |error| {max_error:.2e} exceeds {TOLERANCE:.0e}")
+
+        tiled = np.resize(X, (args.rows, X.shape[1]))
+        results.append({
+            "model": key,
+            "trees": ensemble.feature.shape[0],
+            "depth": ensemble.max_depth,
+            "dataset_rows": len(X),
+            "max_abs_error": max_error,
+            "xgboost_rows_s": rows_per_second(model.predict_proba, tiled, args.repeats),
+            "numpy_rows_s": rows_per_second(ensemble.predict_proba, tiled, args.repeats),
+            "numpy_kb": ensemble.nbytes / 1024,
+        })
+
+    df = pd.DataFrame(results).set_index("model")
+    df["numpy_vs_xgboost"] = df["numpy_rows_s"] / df["xgboost_rows_s"]
+    with pd.option_context("display.float_format", "{:,.3g}".format):
+        print(df.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import argparse
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+
+# Per-disease calibration of the models' probabilities into risk scores, plus the decision
+# threshold applied to those scores. Fitted on the holdout split of the Training notebooks
+# (train_test_split(test_size=0.2, random_state=42)), whose rows the models never saw:
+#   python calibration.py --method isotonic --threshold lung_cancer=0.3
+# Edits to the file are picked up without a restart.
+CALIBRATION_PATH = "Models/calibration.json"
+METHODS = ("isotonic", "platt", "none")
+DEFAULT_THRESHOLD = 0.5
+HOLDOUT_SIZE = 0.2
+HOLDOUT_SEED = 42
+
+_EPS = 1e-6
+
+logger = logging.getLogger(__name__)
+
+
+def _logit(p):
+    p = np.clip(p, _EPS, 1 - _EPS)
+    return np.log(p / (1 - p))
+
+
+class Calibrator:
+    """Maps a batch of raw probabilities to calibrated risk scores with one vectorized call."""
+
+    def __init__(self, method="none", threshold=DEFAULT_THRESHOLD, params=None):
+        if method not in METHODS:
+            raise ValueError(f"Unknown calibration method: {method}")
+        self.method = method
+        self.threshold = threshold
+        self.params = params or {}
+        # Modification time of the calibration file this came from; part of prediction cache keys
+        self.version = None
+        if method == "isotonic":
+            self._x = np.asarray(self.params["x"], dtype=np.float64)
+            self._y = np.asarray(self.params["y"], dtype=np.float64)
+
+    def __call__(self, probabilities):
+        p = np.asarray(probabilities, dtype=np.float64)
+        if self.method == "isotonic":
+            # Piecewise-linear between the fitted breakpoints, clipped at both ends
+            return np.interp(p, self._x, self._y)
+        if self.method == "platt":
+            return 1 / (1 + np.exp(-(self.params["a"] * _logit(p) + self.params["b"])))
+        return p
+
+    def to_dict(self):
+        return {"method": self.method, "threshold": self.threshold, "params": self.params}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("method", "none"), data.get("threshold", DEFAULT_THRESHOLD), data.get("params"))
+
+
+_calibrators = {}
+_loaded_mtime = None
+_lock = threading.Lock()
+
+
+def load(path=CALIBRATION_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def get_calibrator(key, path=CALIBRATION_PATH):
+    """Calibrator for a disease; uncalibrated with the default threshold if none was fitted."""
+    global _calibrators, _loaded_mtime
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    if mtime != _loaded_mtime:
+        with _lock:
+            if mtime != _loaded_mtime:
+                try:
+                    calibrators = {k: Calibrator.from_dict(v) for k, v in load(path).items()}
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    # A malformed file must not take prediction down: keep serving the last good
+                    # calibrators, and try again when the file changes
+                    logger.warning("Ignoring unreadable %s, keeping the previous calibration: %s", path, e)
+                    calibrators = _calibrators
+                else:
+                    for calibrator in calibrators.values():
+                        calibrator.version = mtime
+                # One assignment: concurrent readers see either the old set or the new one, never a partial one
+                _calibrators = calibrators
+                _loaded_mtime = mtime
+    return _calibrators.get(key) or Calibrator()
+
+
+def fit(probabilities, labels, method):
+    """Fit a calibrator on holdout probabilities and their true labels."""
+    p = np.asarray(probabilities, dtype=np.float64)
+    y = np.asarray(labels, dtype=np.float64)
+    if method == "isotonic":
+        from sklearn.isotonic import IsotonicRegression
+
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(p, y)
+        params = {"x": iso.X_thresholds_.tolist(), "y": iso.y_thresholds_.tolist()}
+    elif method == "platt":
+        from sklearn.linear_model import LogisticRegression
+
+        lr = LogisticRegression(C=1e6).fit(_logit(p).reshape(-1, 1), y)
+        params = {"a": float(lr.coef_[0, 0]), "b": float(lr.intercept_[0])}
+    else:
+        params = {}
+    return Calibrator(method, params=params)
+
+
+def holdout(key):
+    """The Training notebooks' test split of a disease dataset, as (matrix, labels)."""
+    from sklearn.model_selection import train_test_split
+
+    import datasets
+
+    X, y = datasets.load(key)
+    _, X_test, _, y_test = train_test_split(X.to_numpy(), y, test_size=HOLDOUT_SIZE, random_state=HOLDOUT_SEED)
+    return X_test, y_test.astype(np.float64)
+
+
+def _brier(p, y):
+    return float(np.mean((p - y) ** 2))
+
+
+def main():
+    import inference
+    from model_registry import get_registry
+
+    parser = argparse.ArgumentParser(description="Fit per-disease probability calibration on the holdout split")
+    parser.add_argument("models", nargs="*",
+                        help=f"models to calibrate (default: all of {', '.join(inference.DISEASES)})")
+    parser.add_argument("--method", default="isotonic", choices=METHODS)
+    parser.add_argument("--threshold", action="append", default=[], metavar="MODEL=VALUE",
+                        help="decision threshold on the risk score, e.g. lung_cancer=0.3 (repeatable)")
+    parser.add_argument("--path", default=CALIBRATION_PATH)
+    args = parser.parse_args()
+
+    unknown = [m for m in args.models if m not in inference.DISEASES]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+    thresholds = {}
+    for item in args.threshold:
+        name, _, value = item.partition("=")
+        if name not in inference.DISEASES:
+            parser.error(f"unknown model in --threshold: {name}")
+        thresholds[name] = float(value)
+
+    entries = load(args.path)
+    registry = get_registry()
+    for key in args.models or inference.DISEASES:
+        model = registry.get(key)
+        if model is None:
+            print(f"{key}: skipped ({registry.error(key)})")
+            continue
+        X_test, y_test = holdout(key)
+        raw = inference.predict_proba(model, X_test)
+        calibrator = fit(raw, y_test, args.method)
+        calibrator.threshold = thresholds.get(key, entries.get(key, {}).get("threshold", DEFAULT_THRESHOLD))
+        entry = calibrator.to_dict()
+        # Brier scores on the calibration rows themselves, so the calibrated one is optimistic
+        entry["holdout"] = {"rows": len(y_test), "brier_raw": _brier(raw, y_test),
+                            "brier_calibrated": _brier(calibrator(raw), y_test)}
+        entries[key] = entry
+        print(f"{key}: {args.method}, threshold {calibrator.threshold:.2f}, {len(y_test)} holdout rows, "
+              f"Brier {entry['holdout']['brier_raw']:.4f} -> {entry['holdout']['brier_calibrated']:.4f}")
+
+    for key, value in thresholds.items():
+        entries.setdefault(key, Calibrator().to_dict())["threshold"] = value
+
+    # Written next to the real file and renamed over it, so running processes never read a partial file
+    os.makedirs(os.path.dirname(args.path) or ".", exist_ok=True)
+    tmp = f"{args.path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entries, f, indent=2)
+    os.replace(tmp, args.path)
+    print(f"Wrote {args.path}")
+
+
+if __name__ == "__main__":
+    main()
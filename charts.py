@@ -0,0 +1,184 @@
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+import pandas as pd
+import streamlit as st
+
+
+# Chart layer for the fitness and mood pages. Charts are keyed on a hash of the
+# aggregated data they show, so reruns with unchanged data reuse the rendered output.
+#   "static"      - matplotlib/seaborn rendered once to PNG; the figure is freed right away
+#   "interactive" - Vega-Lite spec (altair) rendered in the browser
+MODES = {"Static (cached images)": "static", "Interactive (Vega-Lite)": "interactive"}
+MAX_CACHED_CHARTS = 128
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = defaultdict(lambda: {"renders": 0, "hits": 0, "render_ms": 0.0, "last_ms": 0.0})
+
+
+def data_hash(data, *params):
+    digest = hashlib.sha1(repr(params).encode())
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        digest.update(repr(list(data.columns) if isinstance(data, pd.DataFrame) else data.name).encode())
+    else:
+        digest.update(repr(data).encode())
+    return digest.hexdigest()
+
+
+def _memoized(name, mode, key, build):
+    cache_key = (name, mode, key)
+    with _cache_lock:
+        if cache_key in _cache:
+            _cache.move_to_end(cache_key)
+            _stats[(name, mode)]["hits"] += 1
+            return _cache[cache_key]
+
+    start = time.perf_counter()
+    chart = build()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with _cache_lock:
+        stats = _stats[(name, mode)]
+        stats["renders"] += 1
+        stats["render_ms"] += elapsed_ms
+        stats["last_ms"] = elapsed_ms
+        _cache[cache_key] = chart
+        while len(_cache) > MAX_CACHED_CHARTS:
+            _cache.popitem(last=False)
+    return chart
+
+
+def _png(draw, figsize):
+    # Figures built without pyplot are not tracked globally and are freed once rendered
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    draw(ax)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    fig.clear()
+    return buffer.getvalue()
+
+
+def _show(chart, mode):
+    if mode == "interactive":
+        st.altair_chart(chart, use_container_width=True)
+    else:
+        st.image(chart, use_container_width=True)
+
+
+def line_chart(name, series, title, xlabel, ylabel, color="red", mode="static"):
+    def build():
+        if mode == "interactive":
+            import altair as alt
+
+            data = pd.DataFrame({xlabel: series.index, ylabel: series.values})
+            return alt.Chart(data, title=title).mark_line(point=True, color=color).encode(
+                x=alt.X(f"{xlabel}:T"), y=alt.Y(f"{ylabel}:Q"), tooltip=[f"{xlabel}:T", f"{ylabel}:Q"]
+            )
+
+        def draw(ax):
+            import seaborn as sns
+
+            sns.lineplot(x=series.index, y=series.values, marker="o", color=color, ax=ax)
+            ax.set_title(title, fontsize=14)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.grid(True)
+
+        return _png(draw, (8, 4))
+
+    _show(_memoized(name, mode, data_hash(series, title, color), build), mode)
+
+
+def bar_chart(name, series, title, xlabel, ylabel, palette="viridis", mode="static"):
+    def build():
+        if mode == "interactive":
+            import altair as alt
+
+            data = pd.DataFrame({xlabel: series.index, ylabel: series.values})
+            colors = alt.Scale(range=palette) if isinstance(palette, list) else alt.Scale(scheme=palette)
+            return alt.Chart(data, title=title).mark_bar().encode(
+                x=alt.X(f"{xlabel}:N", sort="-y"), y=alt.Y(f"{ylabel}:Q"),
+                color=alt.Color(f"{xlabel}:N", scale=colors, legend=None), tooltip=[xlabel, ylabel]
+            )
+
+        def draw(ax):
+            import seaborn as sns
+
+            ax.set_facecolor("white")
+            sns.barplot(x=series.index, y=series.values, hue=series.index, palette=palette, legend=False, ax=ax)
+            ax.set_title(title, fontsize=14, color="black")
+            ax.set_xlabel(xlabel, fontsize=12, color="black")
+            ax.set_ylabel(ylabel, fontsize=12, color="black")
+            ax.tick_params(axis="x", colors="black")
+            ax.tick_params(axis="y", colors="black")
+
+        return _png(draw, (7, 4))
+
+    _show(_memoized(name, mode, data_hash(series, title, palette), build), mode)
+
+
+def contribution_chart(name, series, title, xlabel, mode="static"):
+    # Horizontal bars, red for values that push the prediction up and blue for those pushing it down
+    colors = ["#d62728" if value > 0 else "#1f77b4" for value in series.values]
+
+    def build():
+        if mode == "interactive":
+            import altair as alt
+
+            data = pd.DataFrame({"Feature": series.index, xlabel: series.values, "color": colors})
+            return alt.Chart(data, title=title).mark_bar().encode(
+                x=alt.X(f"{xlabel}:Q"), y=alt.Y("Feature:N", sort=None),
+                color=alt.Color("color:N", scale=None), tooltip=["Feature", xlabel]
+            )
+
+        def draw(ax):
+            ax.barh(series.index[::-1], series.values[::-1], color=colors[::-1])
+            ax.axvline(0, color="gray", linewidth=0.8)
+            ax.set_title(title, fontsize=14)
+            ax.set_xlabel(xlabel)
+
+        return _png(draw, (7, max(2.5, 0.35 * len(series))))
+
+    _show(_memoized(name, mode, data_hash(series, title, xlabel), build), mode)
+
+
+def calendar_heatmap(name, grid, title, mode="static"):
+    # grid: Month x Day DataFrame of scores
+    def build():
+        if mode == "interactive":
+            import altair as alt
+
+            data = grid.stack().rename("Score").reset_index()
+            return alt.Chart(data, title=title).mark_rect(stroke="gray", strokeWidth=0.5).encode(
+                x=alt.X("Day:O"), y=alt.Y("Month:O"),
+                color=alt.Color("Score:Q", scale=alt.Scale(scheme="yellowgreenblue")), tooltip=["Month", "Day", "Score"]
+            )
+
+        def draw(ax):
+            import seaborn as sns
+
+            sns.heatmap(grid, cmap="YlGnBu", linewidths=0.5, linecolor="gray", ax=ax)
+            ax.set_title(title)
+
+        return _png(draw, (12, 4))
+
+    _show(_memoized(name, mode, data_hash(grid, title), build), mode)
+
+
+def render_stats():
+    """Per-chart render counts, cache hits and render times, for comparing the two modes."""
+    with _cache_lock:
+        rows = [
+            {"chart": name, "mode": mode, "renders": s["renders"], "cache_hits": s["hits"],
+             "mean_render_ms": s["render_ms"] / s["renders"] if s["renders"] else 0.0, "last_render_ms": s["last_ms"]}
+            for (name, mode), s in _stats.items()
+        ]
+    return pd.DataFrame(rows)
@@ -0,0 +1,90 @@
+import argparse
+import os
+
+import numpy as np
+
+from tree_evaluator import TreeEnsemble
+
+
+# Compact exports of the joblib models, in order of preference:
+#   numpy  - flattened tree arrays scored by tree_evaluator.py, no xgboost import at all
+#   native - raw XGBoost booster scored with inplace_predict, no sklearn unpickling or DMatrix
+COMPILED_DIR = "Models/compiled"
+FORMATS = {"numpy": ".npz", "native": ".ubj"}
+
+
+def compiled_path(key, model_format="native"):
+    return os.path.join(COMPILED_DIR, f"{key}{FORMATS[model_format]}")
+
+
+class BoosterModel:
+    """Minimal predict/predict_proba wrapper around a raw binary:logistic booster."""
+
+    def __init__(self, booster):
+        self.booster = booster
+
+    @classmethod
+    def load(cls, path):
+        import xgboost
+
+        booster = xgboost.Booster()
+        booster.load_model(path)
+        return cls(booster)
+
+    def get_booster(self):
+        return self.booster
+
+    def predict_proba(self, X):
+        positive = self.booster.inplace_predict(np.asarray(X, dtype=np.float32), validate_features=False)
+        return np.column_stack([1 - positive, positive])
+
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+
+LOADERS = {"numpy": TreeEnsemble.load, "native": BoosterModel.load}
+
+
+def is_fresh(key, source_path, model_format="native"):
+    # Only trust an export that is at least as new as the joblib it came from
+    path = compiled_path(key, model_format)
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(source_path) or os.path.getmtime(path) >= os.path.getmtime(source_path)
+
+
+def fresh_format(key, source_path):
+    # Best available export for this model, or None to fall back to joblib
+    for model_format in FORMATS:
+        if is_fresh(key, source_path, model_format):
+            return model_format
+    return None
+
+
+def export_model(key, source_path):
+    import joblib
+
+    booster = joblib.load(source_path).get_booster()
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    booster.save_model(compiled_path(key, "native"))
+    TreeEnsemble.from_booster(booster).save(compiled_path(key, "numpy"))
+    return [compiled_path(key, model_format) for model_format in FORMATS]
+
+
+def main():
+    from model_registry import MODEL_PATHS
+
+    parser = argparse.ArgumentParser(description="Export the joblib models to fast inference formats")
+    parser.add_argument("models", nargs="*", help=f"Models to export (default: all of {', '.join(MODEL_PATHS)})")
+    args = parser.parse_args()
+    unknown = sorted(set(args.models) - set(MODEL_PATHS))
+    if unknown:
+        parser.error(f"unknown models: {', '.join(unknown)}")
+
+    for key in args.models or MODEL_PATHS:
+        for path in export_model(key, MODEL_PATHS[key]):
+            print(f"✅ {key}: {MODEL_PATHS[key]} -> {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from collections import deque
+
+
+# Limits per chat session. Token counts are estimated at ~4 characters per token,
+# which is close enough for budgeting without pulling in a tokenizer.
+MAX_STORED_MESSAGES = 40
+MAX_SESSION_CHARS = 60_000
+PROMPT_TOKEN_BUDGET = 3_000
+SUMMARY_TOKEN_BUDGET = 500
+RENDER_WINDOW = 20
+SUMMARY_LINE_CHARS = 160
+
+GREETING = "Hello! 😊 I'm your AI Health Assistant. How can I help you today?"
+PREAMBLE = "You are a helpful health assistant. Continue this conversation."
+
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+
+class ConversationManager:
+    """Bounded chat history: recent turns verbatim, older turns folded into a rolling summary."""
+
+    def __init__(self):
+        self.messages = deque([{"role": "assistant", "content": GREETING}])
+        self.summary_lines = deque()
+        self.summarized_count = 0
+        self.last_prompt_tokens = 0
+        # Summary and recent turns the last prompt was built from; empty for a stand-alone question
+        self.last_context = ""
+        self._chars = len(GREETING)
+
+    def add(self, role, content):
+        self.messages.append({"role": role, "content": content})
+        self._chars += len(content)
+        # Cap memory: fold the oldest messages into the summary once a limit is hit
+        while len(self.messages) > 1 and (len(self.messages) > MAX_STORED_MESSAGES or self._chars > MAX_SESSION_CHARS):
+            self._summarize(self.messages.popleft())
+
+    def _summarize(self, message):
+        self._chars -= len(message["content"])
+        self.summarized_count += 1
+        text = " ".join(message["content"].split())
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[:SUMMARY_LINE_CHARS - 1] + "…"
+        self.summary_lines.append(f"{'User' if message['role'] == 'user' else 'Assistant'}: {text}")
+        while estimate_tokens("\n".join(self.summary_lines)) > SUMMARY_TOKEN_BUDGET and len(self.summary_lines) > 1:
+            self.summary_lines.popleft()
+
+    @property
+    def has_context(self):
+        # True once there is an earlier user turn the next answer may depend on
+        return self.summarized_count > 0 or any(m["role"] == "user" for m in self.messages)
+
+    def build_prompt(self, query):
+        """Summary of older turns + as many recent turns as fit the token budget + the new question."""
+        if not self.has_context:
+            # Nothing said yet beyond the greeting; send the question on its own
+            self.last_prompt_tokens = estimate_tokens(query)
+            self.last_context = ""
+            return query
+
+        # 16 tokens of slack for section headers and separators
+        budget = PROMPT_TOKEN_BUDGET - estimate_tokens(PREAMBLE) - estimate_tokens(query) - 16
+        summary = "\n".join(self.summary_lines)
+        if summary:
+            budget -= estimate_tokens(summary)
+
+        recent = []
+        for message in reversed(self.messages):
+            line = f"{'User' if message['role'] == 'user' else 'Assistant'}: {message['content']}"
+            cost = estimate_tokens(line)
+            if cost > budget:
+                break
+            recent.append(line)
+            budget -= cost
+
+        parts = [PREAMBLE]
+        if summary:
+            parts.append("Summary of earlier conversation:\n" + summary)
+        if recent:
+            parts.append("Recent messages:\n" + "\n".join(reversed(recent)))
+        self.last_context = "\n\n".join(parts)
+        parts.append(f"User: {query}\nAssistant:")
+        prompt = "\n\n".join(parts)
+        self.last_prompt_tokens = estimate_tokens(prompt)
+        return prompt
+
+    def visible_messages(self):
+        # Only the latest messages are re-rendered on each rerun
+        return list(self.messages)[-RENDER_WINDOW:]
+
+    def hidden_count(self):
+        return self.summarized_count + max(len(self.messages) - RENDER_WINDOW, 0)
+
+    def memory_bytes(self):
+        return (sum(len(m["content"].encode()) for m in self.messages)
+                + sum(len(line.encode()) for line in self.summary_lines))
@@ -0,0 +1,205 @@
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import inference
+from model_registry import file_hash
+
+
+# Typed, columnar copies of Datasets/*.csv for training, calibration, explanations and drift
+# checks. Each CSV is parsed once: headers are cleaned, string codes mapped (lung cancer
+# GENDER M/F and LUNG_CANCER YES/NO) and the result written as an uncompressed Arrow IPC file
+# with explicit types - features as float32 in the order the models and the Disease
+# Prediction forms use, the target as int8. Later loads memory-map the file instead of
+# re-parsing text, and a copy is rebuilt whenever its source CSV changes:
+#   python datasets.py                 # convert every dataset up front
+#   python benchmarks/dataset_load.py  # load time vs pd.read_csv
+DATASET_CACHE_DIR = os.environ.get("HEALTHAPP_DATASET_CACHE", ".cache/datasets")
+SOURCE_HASH_KEY = b"source_sha256"
+
+# A scored batch feature is flagged when its mean moves this many training standard
+# deviations, or when this share of its values falls outside the training range
+DRIFT_SHIFT = 0.5
+DRIFT_OUT_OF_RANGE = 0.05
+
+_tables = {}
+_reference = {}
+_lock = threading.Lock()
+
+
+def cache_path(key):
+    return os.path.join(DATASET_CACHE_DIR, f"{key}.arrow")
+
+
+def schema(key, source_hash=None):
+    """Arrow schema of a disease's cached dataset: the model features, then the target."""
+    import pyarrow as pa
+
+    spec = inference.DISEASES[key]
+    fields = [pa.field(name, pa.float32()) for name in spec["features"]] + [pa.field(spec["target"], pa.int8())]
+    return pa.schema(fields, metadata={SOURCE_HASH_KEY: source_hash} if source_hash else None)
+
+
+def read_csv(key):
+    """Parse a disease's raw CSV into the typed DataFrame the cache stores."""
+    spec = inference.DISEASES[key]
+    df = pd.read_csv(spec["dataset"], encoding="utf-8-sig")
+    df.columns = [inference._clean_column(c) for c in df.columns]
+    y = df[spec["target"]]
+    if "target_encoding" in spec:
+        y = y.astype(str).str.strip().str.upper().map(spec["target_encoding"])
+    if y.isna().any():
+        raise inference.SchemaError(f"Unmapped {spec['target']} values in {spec['dataset']}")
+    typed = pd.DataFrame(inference.to_matrix(key, df), columns=spec["features"])
+    typed[spec["target"]] = y.to_numpy(dtype=np.int8)
+    return typed
+
+
+def validate(key, table):
+    """Check a table's columns and types against the model's feature order."""
+    expected = schema(key)
+    if not table.schema.remove_metadata().equals(expected):
+        raise inference.SchemaError(
+            f"Cached {inference.DISEASES[key]['label']} dataset does not match the model schema: "
+            f"expected {expected.names}, got {table.schema.names}"
+        )
+
+
+def _source_hash(key):
+    return file_hash(inference.DISEASES[key]["dataset"])
+
+
+def is_fresh(key):
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(cache_path(key)) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return metadata.get(SOURCE_HASH_KEY) == _source_hash(key).encode()
+
+
+def convert(key):
+    """Write the typed Arrow copy of a disease's CSV and return its path."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(read_csv(key), schema=schema(key, _source_hash(key)), preserve_index=False)
+    validate(key, table)
+    path = cache_path(key)
+    os.makedirs(DATASET_CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+    return path
+
+
+def load_table(key):
+    """The cached dataset as a memory-mapped Arrow table, converting the CSV on first use."""
+    import pyarrow as pa
+
+    path = cache_path(key)
+    with _lock:
+        if not is_fresh(key):
+            convert(key)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _tables.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        validate(key, table)
+        _tables[key] = (mtime, table)
+    return table
+
+
+def matrix(key):
+    """The dataset's features as the float32 matrix the model scores."""
+    table = load_table(key)
+    features = inference.DISEASES[key]["features"]
+    return np.column_stack([table.column(name).to_numpy() for name in features])
+
+
+def load(key):
+    """Training data as (features DataFrame in model order, 0/1 labels)."""
+    table = load_table(key)
+    spec = inference.DISEASES[key]
+    X = pd.DataFrame(matrix(key), columns=spec["features"])
+    return X, table.column(spec["target"]).to_numpy()
+
+
+def reference_stats(key):
+    """Per-feature mean, std, min and max of the training data, for drift checks."""
+    table = load_table(key)
+    cached = _reference.get(key)
+    if cached is not None and cached[0] is table:
+        return cached[1]
+    X = matrix(key).astype(np.float64)
+    stats = pd.DataFrame({"mean": np.nanmean(X, axis=0), "std": np.nanstd(X, axis=0), "min": np.nanmin(X, axis=0),
+                          "max": np.nanmax(X, axis=0)}, index=inference.DISEASES[key]["features"])
+    _reference[key] = (table, stats)
+    return stats
+
+
+class DriftMonitor:
+    """Accumulates feature statistics over scored batches and compares them with the training data."""
+
+    def __init__(self, key):
+        self.key = key
+        self.reference = reference_stats(key)
+        self.rows = 0
+        self._sums = np.zeros(len(self.reference))
+        self._counts = np.zeros(len(self.reference))
+        self._out_of_range = np.zeros(len(self.reference))
+
+    def update(self, batch):
+        X = np.asarray(batch, dtype=np.float64)
+        present = ~np.isnan(X)
+        self.rows += len(X)
+        self._sums += np.where(present, X, 0.0).sum(axis=0)
+        self._counts += present.sum(axis=0)
+        outside = (X < self.reference["min"].to_numpy()) | (X > self.reference["max"].to_numpy())
+        self._out_of_range += outside.sum(axis=0)
+
+    def report(self):
+        """One row per feature, most shifted first, with a drifted flag."""
+        counts = np.maximum(self._counts, 1)
+        report = pd.DataFrame({
+            "train_mean": self.reference["mean"],
+            "batch_mean": self._sums / counts,
+        })
+        scale = self.reference["std"].replace(0, 1.0)
+        report["shift_std"] = (report["batch_mean"] - report["train_mean"]) / scale
+        report["out_of_range"] = self._out_of_range / counts
+        report["drifted"] = (report["shift_std"].abs() > DRIFT_SHIFT) | (report["out_of_range"] > DRIFT_OUT_OF_RANGE)
+        return report.reindex(report["shift_std"].abs().sort_values(ascending=False).index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert Datasets/*.csv into typed, memory-mappable Arrow files")
+    parser.add_argument("models", nargs="*",
+                        help=f"datasets to convert (default: all of {', '.join(inference.DISEASES)})")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the copy is up to date")
+    args = parser.parse_args()
+
+    unknown = [m for m in args.models if m not in inference.DISEASES]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+
+    for key in args.models or inference.DISEASES:
+        if not args.force and is_fresh(key):
+            print(f"{key}: up to date ({cache_path(key)})")
+            continue
+        start = time.perf_counter()
+        path = convert(key)
+        table = load_table(key)
+        print(f"{key}: {table.num_rows} rows x {table.num_columns} columns -> {path} "
+              f"({os.path.getsize(path) / 1024:.1f} KB, {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
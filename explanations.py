@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import calibration
+import compiled_models
+import datasets
+import inference
+from model_registry import ModelLoadError, file_hash, version_label
+
+
+# Per-prediction feature contributions from XGBoost's native TreeSHAP (pred_contribs).
+# Contributions are in log-odds and, with the bias term, sum to the model's margin, so a
+# single booster call yields both the explanation and the probability. Each result comes
+# with the version of the model that produced it.
+# Global importance (mean |contribution| over a disease's dataset) is computed once per
+# model/dataset version and cached in memory and under IMPORTANCE_DIR.
+IMPORTANCE_DIR = "Models/explanations"
+
+_boosters = {}
+_importance = {}
+_lock = threading.Lock()
+
+
+def _load_booster(key, model, version, registry):
+    # Reuse the registry's model when it wraps a booster; the NumPy evaluator has none
+    if hasattr(model, "get_booster"):
+        return model.get_booster(), version
+    source = registry.model_paths[key]
+    if compiled_models.is_fresh(key, source, "native"):
+        booster = compiled_models.BoosterModel.load(compiled_models.compiled_path(key, "native")).get_booster()
+    else:
+        import joblib
+
+        booster = joblib.load(source).get_booster()
+    # Read from disk, which may already hold a version the watcher has not swapped in yet
+    sha256 = file_hash(source)
+    if sha256 != version.get("sha256"):
+        version = {"version": version_label(key, source, sha256), "sha256": sha256}
+    return booster, version
+
+
+def _registry(registry):
+    if registry is None:
+        from model_registry import get_registry
+
+        registry = get_registry()
+    return registry
+
+
+def versioned_booster(key, registry=None):
+    """The booster explaining the serving model, and the version of the model it was built from."""
+    # Cached per model version: a hot-reloaded model gets its own booster
+    registry = _registry(registry)
+    model, version = registry.current(key)
+    if model is None:
+        raise ModelLoadError(registry.error(key))
+    cached = _boosters.get(key)
+    if cached is None or cached[0] != version["sha256"]:
+        with _lock:
+            cached = _boosters.get(key)
+            if cached is None or cached[0] != version["sha256"]:
+                cached = _boosters[key] = (version["sha256"], *_load_booster(key, model, version, registry))
+    return cached[1], cached[2]
+
+
+def get_booster(key, registry=None):
+    return versioned_booster(key, registry)[0]
+
+
+def versioned_contributions(key, matrix, registry=None):
+    """TreeSHAP contributions for a batch, and the version of the model that produced them."""
+    import xgboost
+
+    booster, version = versioned_booster(key, registry)
+    data = xgboost.DMatrix(np.asarray(matrix, dtype=np.float32))
+    return booster.predict(data, pred_contribs=True, validate_features=False), version
+
+
+def contributions(key, matrix, registry=None):
+    """TreeSHAP contributions for a batch: one column per feature plus a final bias column."""
+    return versioned_contributions(key, matrix, registry)[0]
+
+
+def probabilities(contribs):
+    # Sum of contributions + bias is the margin; the sigmoid turns it into predict_proba's output
+    return 1 / (1 + np.exp(-np.asarray(contribs, dtype=np.float64).sum(axis=1)))
+
+
+def explain(key, matrix, registry=None):
+    """Calibrated risk scores and contributions for a batch from one TreeSHAP pass, and the model version used."""
+    contribs, version = versioned_contributions(key, matrix, registry)
+    return calibration.get_calibrator(key)(probabilities(contribs)), contribs, version
+
+
+def as_series(key, contrib_row):
+    """One row of contributions as a feature -> log-odds Series, largest effect first."""
+    series = pd.Series(contrib_row[:-1], index=inference.DISEASES[key]["features"], name="contribution")
+    return series.reindex(series.abs().sort_values(ascending=False).index)
+
+
+def _signature(*paths):
+    return [f"{os.path.getsize(p)}:{os.stat(p).st_mtime_ns}" if os.path.exists(p) else None for p in paths]
+
+
+def global_importance(key, registry=None):
+    """Mean |contribution| of each feature over the disease's dataset, largest first."""
+    spec = inference.DISEASES[key]
+    signature = _signature(_registry(registry).model_paths[key], spec["dataset"])
+    cached = _importance.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    path = os.path.join(IMPORTANCE_DIR, f"{key}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = None
+    if stored is not None and stored.get("signature") == signature:
+        importance = pd.Series(stored["importance"], name="importance")
+    else:
+        contribs = contributions(key, datasets.matrix(key), registry)
+        importance = pd.Series(np.abs(contribs[:, :-1]).mean(axis=0).astype(float), index=spec["features"],
+                               name="importance")
+        importance = importance.sort_values(ascending=False)
+        os.makedirs(IMPORTANCE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "rows": len(contribs), "importance": importance.to_dict()}, f, indent=2)
+
+    _importance[key] = (signature, importance)
+    return importance
@@ -0,0 +1,221 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+import calibration
+from schemas import SCHEMAS, SchemaError
+
+
+# Dataset and target of each model. Feature names and order, types and encodings come
+# from the model's schema in schemas.py; names match the Datasets/*.csv headers.
+DISEASES = {
+    "diabetes": {
+        "label": "Diabetes",
+        "dataset": "Datasets/diabetes_data.csv",
+        "target": "Outcome",
+        "features": SCHEMAS["diabetes"].names,
+    },
+    "heart_disease": {
+        "label": "Heart Disease",
+        "dataset": "Datasets/heart_disease_data.csv",
+        "target": "target",
+        "features": SCHEMAS["heart_disease"].names,
+    },
+    "lung_cancer": {
+        "label": "Lung Cancer",
+        "dataset": "Datasets/survey lung cancer.csv",
+        "target": "LUNG_CANCER",
+        "features": SCHEMAS["lung_cancer"].names,
+        "target_encoding": {"YES": 1, "NO": 0},
+    },
+    "parkinsons": {
+        "label": "Parkinson's",
+        "dataset": "Datasets/parkinson_data.csv",
+        "target": "status",
+        "features": SCHEMAS["parkinsons"].names,
+    },
+    "hypo_thyroid": {
+        "label": "Hypo-Thyroid",
+        "dataset": "Datasets/prepocessed_hypothyroid.csv",
+        "target": "binaryClass",
+        "features": SCHEMAS["hypo_thyroid"].names,
+    },
+}
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def disease_key(disease):
+    # "Parkinson's" -> "parkinsons", "Hypo-Thyroid" -> "hypo_thyroid"
+    return disease.replace("'", "").replace("-", "_").replace(" ", "_").lower()
+
+
+def _clean_column(name):
+    # Dataset headers carry stray BOMs and trailing spaces ("FATIGUE ", "\ufeffage")
+    return str(name).replace("\ufeff", "").strip()
+
+
+def validate_columns(key, columns):
+    """Check an uploaded header against the model's features and return the column rename map."""
+    features = DISEASES[key]["features"]
+    cleaned = {_clean_column(c): c for c in columns}
+    missing = [f for f in features if f not in cleaned]
+    if missing:
+        raise SchemaError(f"Missing required columns for {DISEASES[key]['label']}: {', '.join(missing)}")
+    return {cleaned[f]: f for f in features}
+
+
+def to_matrix(key, df, rename=None, errors="raise"):
+    """Encode a DataFrame of patients into the float matrix the model expects (see Schema.encode for errors)."""
+    if rename is None:
+        rename = validate_columns(key, df.columns)
+    return SCHEMAS[key].encode(df[list(rename)].rename(columns=rename), errors)
+
+
+def _record_values(key, record):
+    # A name -> value record's values in feature order, tolerating the same header noise as uploads
+    names = DISEASES[key]["features"]
+    if not all(name in record for name in names):
+        record = {_clean_column(name): value for name, value in record.items()}
+        missing = [name for name in names if name not in record]
+        if missing:
+            raise SchemaError(f"Missing required columns for {DISEASES[key]['label']}: {', '.join(missing)}")
+    return [record[name] for name in names]
+
+
+def records_to_matrix(key, records):
+    """Build and validate the model matrix from ordered feature lists or name->value dicts.
+
+    Values outside the schema's ranges or category codes raise SchemaError, as the forms would refuse them.
+    """
+    schema = SCHEMAS[key]
+    if not records:
+        raise SchemaError("No records to score")
+    if isinstance(records[0], dict):
+        # Picked by name straight into feature order; a DataFrame costs milliseconds per request
+        matrix = np.stack([schema.encode_record(_record_values(key, record)) for record in records])
+    else:
+        try:
+            matrix = np.asarray(records, dtype=np.float32).reshape(len(records), -1)
+        except (TypeError, ValueError):
+            # Category labels ("Yes", "M", ...) among the values: encode record by record with dict
+            # lookups, which is far cheaper than building a DataFrame for a handful of rows
+            if any(len(record) != len(schema.names) for record in records):
+                raise SchemaError(f"{DISEASES[key]['label']} expects {len(schema.names)} features per record")
+            matrix = np.stack([schema.encode_record(record) for record in records])
+        if matrix.shape[1] != len(schema.names):
+            raise SchemaError(f"{DISEASES[key]['label']} expects {len(schema.names)} features, got {matrix.shape[1]}")
+
+    errors = schema.validate(matrix)
+    if errors:
+        raise SchemaError(f"Invalid {DISEASES[key]['label']} input: " + "; ".join(errors))
+    return matrix
+
+
+def predict_proba(model, matrix):
+    # Probability of the positive class for every row, in one call
+    return model.predict_proba(matrix)[:, 1]
+
+
+def risk_scores(key, model, matrix):
+    # Calibrated risk for every row; calibration is one vectorized pass over the batch
+    return calibration.get_calibrator(key)(predict_proba(model, matrix))
+
+
+def iter_upload_chunks(file, file_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Read the upload piece by piece so very large files never sit fully in a DataFrame
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(file, chunksize=chunk_size, encoding="utf-8-sig")
+
+
+def score_chunks(model, key, chunks, threshold=None, monitor=None, version=None):
+    """Score each chunk with a single vectorized predict_proba call and yield it back with results.
+
+    Rows the schema rejects are not scored: their results are empty and the error column says why.
+    With the model's registry version, scored rows also name the model_version and model_sha256.
+    A datasets.DriftMonitor passed as monitor sees the feature matrix of every valid row.
+    """
+    schema = SCHEMAS[key]
+    calibrator = calibration.get_calibrator(key)
+    if threshold is None:
+        threshold = calibrator.threshold
+    rename = None
+    for chunk in chunks:
+        if rename is None:
+            rename = validate_columns(key, chunk.columns)
+        # Unknown labels and unparsable values become NaN, so row_errors rejects just their rows
+        matrix = to_matrix(key, chunk, rename, errors="coerce")
+        errors = schema.row_errors(matrix)
+        valid = errors == ""
+        if monitor is not None:
+            monitor.update(matrix[valid])
+        probabilities = np.full(len(matrix), np.nan)
+        risk = np.full(len(matrix), np.nan)
+        if valid.any():
+            probabilities[valid] = predict_proba(model, matrix[valid])
+            risk[valid] = calibrator(probabilities[valid])
+        scored = chunk.copy()
+        scored["probability"] = probabilities
+        scored["risk_score"] = risk
+        prediction = pd.Series((risk >= threshold).astype(np.int8), index=chunk.index, dtype="Int8")
+        scored["prediction"] = prediction.mask(~valid)
+        if version is not None:
+            scored["model_version"] = pd.Series(version.get("version"), index=chunk.index, dtype="string").where(valid)
+            scored["model_sha256"] = pd.Series(version.get("sha256"), index=chunk.index, dtype="string").where(valid)
+        scored["error"] = errors
+        yield scored
+
+
+def count_rows(file, file_format):
+    # Cheap row count for the progress bar; rewinds the file afterwards
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        rows = pq.ParquetFile(file).metadata.num_rows
+    else:
+        rows = max(sum(1 for _ in file) - 1, 0)
+    file.seek(0)
+    return rows
+
+
+def score_upload(model, key, file, file_format, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, monitor=None,
+                 version=None):
+    """Score an uploaded CSV/Parquet file; returns (results as bytes in the same format, rows, rejected rows)."""
+    total = count_rows(file, file_format) or 1
+    writer = None
+    done = 0
+    rejected = 0
+
+    if file_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        out = pa.BufferOutputStream()
+    else:
+        out = io.BytesIO()
+
+    chunks = iter_upload_chunks(file, file_format, chunk_size)
+    for scored in score_chunks(model, key, chunks, monitor=monitor, version=version):
+        if file_format == "parquet":
+            table = pa.Table.from_pandas(scored, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            writer.write_table(table)
+        else:
+            scored.to_csv(out, index=False, header=done == 0)
+        done += len(scored)
+        rejected += int((scored["error"] != "").sum())
+        if progress is not None:
+            progress(min(done / total, 1.0), done)
+
+    if file_format == "parquet":
+        if writer is not None:
+            writer.close()
+        return out.getvalue().to_pybytes(), done, rejected
+    return out.getvalue(), done, rejected
@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+
+# Lottie animations used by the app. Lookups go, in order, to:
+#   1. the in-process memo (a warm rerun makes no network or disk access)
+#   2. BUNDLED_DIR - JSON files shipped with the app (`python lottie_assets.py` fills it)
+#   3. CACHE_DIR   - JSON files downloaded by an earlier run
+#   4. the network, with short timeouts; the result is written to CACHE_DIR
+# A failed fetch returns None and is not retried for RETRY_AFTER_S, so an offline or
+# slow CDN never stalls page renders.
+BUNDLED_DIR = os.path.join("assets", "lottie")
+CACHE_DIR = os.environ.get("HEALTHAPP_ASSET_CACHE", os.path.join(".cache", "lottie"))
+FETCH_TIMEOUT_S = (2, 3)  # (connect, read)
+RETRY_AFTER_S = 300
+
+ANIMATIONS = {
+    "health": "https://assets8.lottiefiles.com/packages/lf20_puciaact.json",
+}
+
+_memo = {}
+_failures = {}
+_lock = threading.Lock()
+_stats = {"memory_hits": 0, "disk_hits": 0, "downloads": 0, "failures": 0}
+
+
+def asset_name(url):
+    return os.path.basename(urlparse(url).path) or "animation.json"
+
+
+def _read(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path, data):
+    # Write to a temporary file first so a concurrent reader never sees a partial file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _download(url):
+    import requests
+
+    response = requests.get(url, timeout=FETCH_TIMEOUT_S)
+    response.raise_for_status()
+    return response.json()
+
+
+def load_lottie(url):
+    """Return the Lottie JSON for a URL, or None when it is not available."""
+    with _lock:
+        if url in _memo:
+            _stats["memory_hits"] += 1
+            return _memo[url]
+        if url in _failures and time.monotonic() - _failures[url] < RETRY_AFTER_S:
+            return None
+
+    name = asset_name(url)
+    data = _read(os.path.join(BUNDLED_DIR, name)) or _read(os.path.join(CACHE_DIR, name))
+    source = "disk_hits"
+    if data is None:
+        try:
+            data = _download(url)
+        except Exception:
+            with _lock:
+                _failures[url] = time.monotonic()
+                _stats["failures"] += 1
+            return None
+        source = "downloads"
+        try:
+            _write(os.path.join(CACHE_DIR, name), data)
+        except OSError:
+            pass  # A read-only checkout still serves the animation from memory
+
+    with _lock:
+        _stats[source] += 1
+        _memo[url] = data
+    return data
+
+
+def stats():
+    with _lock:
+        return dict(_stats, cached=len(_memo))
+
+
+def bundle(urls=None, directory=BUNDLED_DIR):
+    """Download animations into the bundled assets directory; returns the written paths."""
+    paths = []
+    for url in urls or ANIMATIONS.values():
+        path = os.path.join(directory, asset_name(url))
+        _write(path, _download(url))
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    # Usage: python lottie_assets.py [url ...]
+    for path in bundle(argv or None):
+        print(f"Bundled {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,314 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+
+import compiled_models
+
+
+logger = logging.getLogger(__name__)
+
+# Trained disease models, keyed by the normalized disease name used in app.py
+MODEL_PATHS = {
+    "diabetes": "Models/xgboost_diabetes_model.joblib",
+    "heart_disease": "Models/xgboost_heartdisease_model.joblib",
+    "lung_cancer": "Models/xgboost_Lung_Cancer_model.joblib",
+    "parkinsons": "Models/xgboost_parkinsons_model.joblib",
+    "hypo_thyroid": "Models/xgboost_hypothyroid_model.joblib"
+}
+# Where train.py keeps every trained version (<model>/<version>/model.joblib + metadata.json)
+VERSIONS_DIR = "Models/versions"
+
+# Loaded models are swapped for a new version when their file in Models/ (or its export) is
+# replaced, e.g. by `python train.py --promote`; the check runs every MODEL_WATCH_S seconds
+# in the background (0 disables it). A new version is warmed up on WARMUP_ROWS dataset rows
+# before it takes traffic. A model that failed to load is retried as soon as its file
+# changes, and otherwise at most every MODEL_RETRY_S seconds.
+MODEL_WATCH_S = float(os.environ.get("INFERENCE_MODEL_WATCH_S", 2))
+MODEL_RETRY_S = float(os.environ.get("INFERENCE_MODEL_RETRY_S", 30))
+WARMUP_ROWS = 64
+
+
+def _model_bytes(model):
+    # Size of the loaded trees, read off the model itself: process-wide tracing on every
+    # (re)load would slow down and skew concurrent loads. Exported numpy ensembles report
+    # their arrays; boosters live in native XGBoost memory, sized by their raw dump.
+    if hasattr(model, "nbytes"):
+        return int(model.nbytes)
+    if not hasattr(model, "get_booster"):
+        return 0
+    try:
+        return len(model.get_booster().save_raw())
+    except Exception:
+        return 0
+
+
+_hashes = {}
+_hashes_lock = threading.Lock()
+
+
+def file_hash(path):
+    """SHA-256 of a file's content, re-read only when its size or mtime changes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _hashes.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    with _hashes_lock:
+        _hashes[path] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
+class ModelLoadError(RuntimeError):
+    pass
+
+
+def _stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _signature(key, source):
+    # Changes whenever the model file or one of its exports is replaced
+    paths = [source] + [compiled_models.compiled_path(key, model_format) for model_format in compiled_models.FORMATS]
+    return tuple(_stat(p) for p in paths)
+
+
+def version_label(key, path, sha256):
+    """train.py's version of a model file (matched by content), or the loaded file's modification time."""
+    try:
+        versions = sorted(os.listdir(os.path.join(VERSIONS_DIR, key)), reverse=True) if sha256 else []
+    except OSError:
+        versions = []
+    for version in versions:
+        try:
+            with open(os.path.join(VERSIONS_DIR, key, version, "metadata.json"), encoding="utf-8") as f:
+                if json.load(f).get("sha256") == sha256:
+                    return version
+        except (OSError, ValueError):
+            continue
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(os.path.getmtime(path)))
+
+
+class ModelRegistry:
+    """Loads each disease model on first use and swaps in new versions of its file as they appear."""
+
+    def __init__(self, model_paths=None):
+        self.model_paths = dict(model_paths or MODEL_PATHS)
+        self._models = {}
+        self._versions = {}
+        self._stats = {}
+        self._errors = {}
+        # key -> (file signature, time) of the last failed load
+        self._failed = {}
+        self._reloads = {}
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._stop = threading.Event()
+
+    def get(self, key):
+        """The serving model, loading it on first use; None (see error()) if it can't be loaded."""
+        # Fast path: already loaded, no locking needed
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        if key not in self.model_paths:
+            raise KeyError(f"Unknown model: {key}")
+        if not self._retry_due(key):
+            return None
+
+        with self._lock:
+            # Another session may have loaded (or failed to load) it while we waited for the lock
+            if key not in self._models and self._retry_due(key):
+                try:
+                    self._install(key, *self._load(key))
+                except ModelLoadError as e:
+                    self._fail(key, str(e))
+        return self._models.get(key)
+
+    def _retry_due(self, key):
+        failed = self._failed.get(key)
+        if failed is None:
+            return True
+        signature, failed_at = failed
+        return (time.monotonic() - failed_at >= MODEL_RETRY_S
+                or _signature(key, self.model_paths[key]) != signature)
+
+    def _fail(self, key, error):
+        self._errors[key] = error
+        self._failed[key] = (_signature(key, self.model_paths[key]), time.monotonic())
+
+    def _load(self, key):
+        # Prefer a fresh export (see compiled_models.py), fall back to joblib
+        source = self.model_paths[key]
+        signature = _signature(key, source)
+        sha256 = file_hash(source)
+        path = source
+        compiled_format = compiled_models.fresh_format(key, source)
+        if compiled_format is not None:
+            path, model_format = compiled_models.compiled_path(key, compiled_format), compiled_format
+            loader = compiled_models.LOADERS[compiled_format]
+        else:
+            # joblib (and xgboost, via unpickling) are only imported when actually needed
+            import joblib
+
+            loader, model_format = joblib.load, "joblib"
+
+        start = time.perf_counter()
+        try:
+            model = loader(path)
+        except FileNotFoundError:
+            raise ModelLoadError(f"Model file {path} not found!")
+        except Exception as e:
+            raise ModelLoadError(f"Error loading model {path}: {str(e)}")
+        finally:
+            elapsed = time.perf_counter() - start
+
+        version = {
+            "version": version_label(key, path, sha256),
+            "sha256": sha256,
+            "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "signature": signature,
+        }
+        stats = {
+            "model": key,
+            "path": path,
+            "format": model_format,
+            "file_size_bytes": os.path.getsize(path),
+            "load_seconds": elapsed,
+            "memory_bytes": _model_bytes(model),
+        }
+        return model, version, stats
+
+    def _install(self, key, model, version, stats):
+        # Version first: readers that see the new model also see its hash
+        self._versions[key] = version
+        self._stats[key] = stats
+        self._errors.pop(key, None)
+        self._failed.pop(key, None)
+        self._models[key] = model
+
+    def reload(self, key):
+        """Load the model's current file in the calling thread, warm it up and swap it in.
+
+        Predictions already running keep the model they started with; the old version stays
+        in service if the new one fails to load or to score the warm-up batch.
+        """
+        try:
+            model, version, stats = self._load(key)
+            warm_up(key, model)
+        except Exception as e:
+            # Don't retry the same broken file on every poll
+            with self._lock:
+                if key in self._models:
+                    self._errors[key] = f"Reload failed, still serving {self.version(key).get('version')}: {e}"
+                    self._versions[key] = dict(self._versions[key], signature=_signature(key, self.model_paths[key]))
+                else:
+                    self._fail(key, str(e))
+            return False
+        with self._lock:
+            previous = self._versions.get(key, {}).get("version")
+            self._install(key, model, version, stats)
+            self._reloads[key] = self._reloads.get(key, 0) + 1
+        logger.info("Reloaded %s: %s -> %s (%s)", key, previous, version["version"], version["sha256"][:12])
+        return True
+
+    def refresh(self):
+        """Reload every loaded or failed model whose file (or export) changed; returns the keys swapped."""
+        changed = [key for key in list(self._models)
+                   if _signature(key, self.model_paths[key]) != self._versions[key]["signature"]]
+        changed += [key for key, (signature, _) in list(self._failed.items())
+                    if key not in self._models and _signature(key, self.model_paths[key]) != signature]
+        return [key for key in changed if self.reload(key)]
+
+    def watch(self, interval_s=MODEL_WATCH_S):
+        """Poll Models/ for new model files from a background thread."""
+        if self._watcher is not None or interval_s <= 0:
+            return
+
+        def run():
+            while not self._stop.wait(interval_s):
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("Model watcher error")
+
+        self._watcher = threading.Thread(target=run, daemon=True, name="model-watcher")
+        self._watcher.start()
+
+    def close(self):
+        self._stop.set()
+
+    def error(self, key):
+        return self._errors.get(key)
+
+    def is_loaded(self, key):
+        return key in self._models
+
+    def version(self, key):
+        """Version label and SHA-256 of the model currently serving predictions ({} if not loaded)."""
+        version = self._versions.get(key)
+        if version is None:
+            return {}
+        return {"version": version["version"], "sha256": version["sha256"], "loaded_at": version["loaded_at"],
+                "reloads": self._reloads.get(key, 0)}
+
+    def current(self, key):
+        """The serving model and its version, read together so a concurrent swap can't mix them."""
+        self.get(key)
+        with self._lock:
+            return self._models.get(key), self.version(key)
+
+    def content_hash(self, key):
+        # Hash of the model serving predictions; of the file on disk before the first load
+        version = self._versions.get(key)
+        return version["sha256"] if version is not None else file_hash(self.model_paths[key])
+
+    def stats(self):
+        return [dict(self._stats[key], **self.version(key)) for key in self.model_paths if key in self._stats]
+
+
+def warm_up(key, model):
+    # Score a batch of real rows before taking traffic: loads lazy state and catches a bad file
+    import inference
+
+    try:
+        import datasets
+
+        batch = datasets.matrix(key)[:WARMUP_ROWS]
+    except Exception:
+        batch = np.zeros((WARMUP_ROWS, len(inference.DISEASES[key]["features"])), dtype=np.float32)
+    probabilities = inference.predict_proba(model, batch)
+    if len(probabilities) != len(batch) or not np.all((probabilities >= 0) & (probabilities <= 1)):
+        raise ModelLoadError("warm-up batch produced invalid probabilities")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    # Module-level singleton: Streamlit re-executes app.py on every rerun but keeps
+    # imported modules, so every session in the process shares the same registry
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+                _registry.watch()
+    return _registry
@@ -0,0 +1,174 @@
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Memoized prediction results, shared by every session in the process. Entries are keyed on
+# the disease, the model version (content hash of the model file, plus the calibration in
+# effect) and a canonical hash of the feature vector, so a retrained model or a new
+# calibration never serves stale results. An optional SQLite tier keeps results across
+# restarts and between worker processes:
+#   INFERENCE_CACHE_DB=prediction_cache.db streamlit run app.py
+# Disk writes never run on the batcher thread: a background writer inserts whatever has
+# queued up in one transaction, and deletes expired rows every EVICT_INTERVAL_S.
+CACHE_TTL_S = float(os.environ.get("INFERENCE_CACHE_TTL_S", 3600))
+CACHE_MAX_ENTRIES = int(os.environ.get("INFERENCE_CACHE_MAX_ENTRIES", 10_000))
+CACHE_DB = os.environ.get("INFERENCE_CACHE_DB")
+WRITE_BATCH = 1000
+EVICT_INTERVAL_S = 60
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+def feature_hash(row):
+    # float32 bytes of the row, with -0.0 folded into 0.0 and every NaN made identical,
+    # so [1, 2.0] and [1.0, 2] (or two NaN encodings) share one entry
+    row = np.asarray(row, dtype=np.float32).ravel()
+    row = np.where(np.isnan(row), np.float32(np.nan), row) + np.float32(0.0)
+    return hashlib.sha1(row.tobytes()).hexdigest()
+
+
+class PredictionCache:
+    """LRU + TTL cache of per-row results, with hit/miss counters and an optional disk tier."""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, ttl_s=CACHE_TTL_S, db_path=CACHE_DB):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.db_path = db_path
+        self.metrics = {"hits": 0, "disk_hits": 0, "misses": 0, "invalidations": 0}
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = None
+
+        if self.db_path:
+            from storage import connect
+
+            with connect(self.db_path) as conn:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS prediction_cache (
+                        key TEXT PRIMARY KEY,
+                        version TEXT NOT NULL,
+                        value BLOB NOT NULL,
+                        created REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS prediction_cache_created ON prediction_cache (created);
+                """)
+            self._writer = threading.Thread(target=self._write, daemon=True, name="prediction-cache-writer")
+            self._writer.start()
+
+    @staticmethod
+    def key(disease, kind, row):
+        return f"{disease}:{kind}:{feature_hash(row)}"
+
+    def get(self, key, version):
+        """Cached result for a key at this model version, or None."""
+        now = time.time()
+        prefix = key.rsplit(":", 1)[0]
+        with self._lock:
+            if self._versions.get(prefix, version) != version:
+                # The model (or its calibration) changed: drop everything computed for the old one
+                for stale in [k for k in self._entries if k.startswith(prefix + ":")]:
+                    del self._entries[stale]
+                self.metrics["invalidations"] += 1
+            self._versions[prefix] = version
+
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] <= self.ttl_s:
+                self._entries.move_to_end(key)
+                self.metrics["hits"] += 1
+                return entry[0]
+
+        value = self._disk_get(key, version, now) if self.db_path else None
+        with self._lock:
+            if value is None:
+                self.metrics["misses"] += 1
+                return None
+            self.metrics["disk_hits"] += 1
+            self._store(key, value, now)
+        return value
+
+    def put(self, key, version, value):
+        now = time.time()
+        with self._lock:
+            if self._versions.get(key.rsplit(":", 1)[0], version) != version:
+                return  # Computed by a model that has since been replaced
+            self._store(key, value, now)
+        if self._writer is not None:
+            self._pending.put((key, version, np.asarray(value, dtype=np.float64).tobytes(), now))
+
+    def _write(self):
+        from storage import open_connection
+
+        conn = open_connection(self.db_path)
+        evicted_at = 0.0
+        while True:
+            # Block for the first row, then take everything else already queued
+            items = [self._pending.get()]
+            while len(items) < WRITE_BATCH:
+                try:
+                    items.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [item for item in items if item is not _STOP]
+            try:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO prediction_cache (key, version, value, created) "
+                                     "VALUES (?, ?, ?, ?)", rows)
+                    now = time.time()
+                    if now - evicted_at >= EVICT_INTERVAL_S:
+                        conn.execute("DELETE FROM prediction_cache WHERE created < ?", (now - self.ttl_s,))
+                        evicted_at = now
+            except sqlite3.Error:
+                logger.exception("Could not write %d prediction cache entries", len(rows))
+            for _ in items:
+                self._pending.task_done()
+            if len(rows) < len(items):
+                conn.close()
+                return
+
+    def flush(self):
+        """Wait until every result put so far is on disk."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def close(self):
+        if self._writer is not None:
+            self._pending.put(_STOP)
+            self._writer.join()
+            self._writer = None
+
+    def _store(self, key, value, now):
+        self._entries[key] = (value, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_get(self, key, version, now):
+        from storage import connect
+
+        with connect(self.db_path) as conn:
+            row = conn.execute("SELECT value, created FROM prediction_cache WHERE key = ? AND version = ?",
+                               (key, version)).fetchone()
+        if row is None or now - row[1] > self.ttl_s:
+            return None
+        value = np.frombuffer(row[0], dtype=np.float64)
+        return value[0] if key.split(":")[1] == "risk" else value
+
+    def stats(self):
+        with self._lock:
+            metrics = dict(self.metrics)
+            entries = len(self._entries)
+        hits = metrics["hits"] + metrics["disk_hits"]
+        lookups = hits + metrics["misses"]
+        return dict(metrics, hit_rate=hits / lookups if lookups else 0.0, entries=entries)
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from storage import DB_PATH, connect
+
+
+# Cache in front of the AI Assistant's LLM calls, persisted in SQLite so it survives
+# restarts. Lookups try the exact query, then a normalized form ("How much water should
+# I drink?" == "how much water should i drink"), then optionally the closest earlier
+# query by embedding similarity. Follow-up questions are cached per conversation context:
+# their keys include a digest of the summary and recent turns the prompt was built from, so
+# "and for children?" only matches the same question asked after the same conversation.
+# Semantic lookup is limited to stand-alone questions.
+CACHE_TTL_S = float(os.environ.get("HEALTHAPP_CACHE_TTL_S", 7 * 24 * 3600))
+CACHE_MAX_ENTRIES = int(os.environ.get("HEALTHAPP_CACHE_MAX_ENTRIES", 5000))
+CACHE_MAX_BYTES = int(os.environ.get("HEALTHAPP_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+SIMILARITY_THRESHOLD = 0.92
+# Semantic lookup costs one embedding call per query, so it is opt-in
+SEMANTIC_CACHE = os.environ.get("HEALTHAPP_SEMANTIC_CACHE") == "1"
+
+
+def normalize(query):
+    return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+
+
+def _key(text, context=""):
+    if context:
+        text = f"{hashlib.sha1(context.encode()).hexdigest()}\n{text}"
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU response cache with exact, normalized and (optional) semantic lookup."""
+
+    def __init__(self, path=DB_PATH, ttl_s=CACHE_TTL_S, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES,
+                 embed_fn=None, similarity_threshold=SIMILARITY_THRESHOLD):
+        self.path = path
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.metrics = {"exact_hits": 0, "normalized_hits": 0, "semantic_hits": 0, "misses": 0,
+                        "latency_saved_s": 0.0}
+        self._lock = threading.Lock()
+        self._embeddings = None
+        self._last_embedding = None
+
+        with connect(self.path) as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    normalized_key TEXT PRIMARY KEY,
+                    exact_key TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    latency_s REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    embedding BLOB
+                );
+                CREATE INDEX IF NOT EXISTS response_cache_exact ON response_cache (exact_key);
+                CREATE INDEX IF NOT EXISTS response_cache_last_used ON response_cache (last_used);
+            """)
+
+    def get(self, query, context=""):
+        """Return the cached response for a query asked after the given conversation context, or None on a miss."""
+        now = time.time()
+        # Expired rows are skipped here and deleted by put(), so a lookup never writes more than last_used
+        fresh = now - self.ttl_s
+        with connect(self.path) as conn:
+            row, kind = conn.execute(
+                "SELECT normalized_key, response, latency_s FROM response_cache WHERE exact_key = ? AND created >= ?",
+                (_key(query.strip(), context), fresh)
+            ).fetchone(), "exact_hits"
+            if row is None:
+                row, kind = conn.execute(
+                    "SELECT normalized_key, response, latency_s FROM response_cache "
+                    "WHERE normalized_key = ? AND created >= ?",
+                    (_key(normalize(query), context), fresh)
+                ).fetchone(), "normalized_hits"
+            if row is None and self.embed_fn is not None and not context:
+                row, kind = self._semantic_match(conn, query, fresh), "semantic_hits"
+            if row is not None:
+                conn.execute("UPDATE response_cache SET last_used = ? WHERE normalized_key = ?", (now, row[0]))
+
+        with self._lock:
+            if row is None:
+                self.metrics["misses"] += 1
+                return None
+            self.metrics[kind] += 1
+            self.metrics["latency_saved_s"] += row[2]
+        return row[1]
+
+    def put(self, query, response, latency_s, context=""):
+        now = time.time()
+        vector = None if context else self._normalized_embedding(query)
+        embedding = vector.tobytes() if vector is not None else None
+        size = len(query.encode()) + len(response.encode()) + (len(embedding) if embedding else 0)
+
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM response_cache WHERE created < ?", (now - self.ttl_s,))
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(normalized_key, exact_key, query, response, created, last_used, latency_s, size, embedding) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_key(normalize(query), context), _key(query.strip(), context), query, response, now, now, latency_s,
+                 size, embedding)
+            )
+            self._evict(conn)
+        with self._lock:
+            self._embeddings = None
+
+    def _evict(self, conn):
+        # Drop least recently used entries until both size limits hold
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        for key, size in conn.execute(
+                "SELECT normalized_key, size FROM response_cache ORDER BY last_used").fetchall():
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM response_cache WHERE normalized_key = ?", (key,))
+            count -= 1
+            total -= size
+
+    def _normalized_embedding(self, text):
+        # A failing embedding call only disables semantic lookup for this query
+        if self.embed_fn is None:
+            return None
+        # A miss embeds the query in get() and again in put(); reuse the first result
+        last = self._last_embedding
+        if last is not None and last[0] == text:
+            return last[1]
+        try:
+            vector = np.asarray(self.embed_fn(text), dtype=np.float32)
+        except Exception:
+            return None
+        vector = vector / (np.linalg.norm(vector) or 1.0)
+        self._last_embedding = (text, vector)
+        return vector
+
+    def _semantic_match(self, conn, query, fresh):
+        # Sessions share one matrix: rebuild and swap it under the lock, then search the snapshot
+        with self._lock:
+            if self._embeddings is None:
+                rows = conn.execute(
+                    "SELECT normalized_key, embedding FROM response_cache WHERE embedding IS NOT NULL").fetchall()
+                keys = [key for key, _ in rows]
+                matrix = np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows]) if rows else None
+                self._embeddings = (keys, matrix)
+            keys, matrix = self._embeddings
+
+        vector = self._normalized_embedding(query)
+        if matrix is None or vector is None:
+            return None
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return conn.execute("SELECT normalized_key, response, latency_s FROM response_cache "
+                            "WHERE normalized_key = ? AND created >= ?", (keys[best], fresh)).fetchone()
+
+    def stats(self):
+        with self._lock:
+            metrics = dict(self.metrics)
+        hits = metrics["exact_hits"] + metrics["normalized_hits"] + metrics["semantic_hits"]
+        lookups = hits + metrics["misses"]
+        with connect(self.path) as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+        return dict(metrics, hits=hits, hit_rate=hits / lookups if lookups else 0.0, entries=entries, bytes=size)
@@ -0,0 +1,56 @@
+import importlib
+import sys
+import threading
+import time
+from collections import defaultdict
+
+
+# Page router for app.py. Each page lives in views/<module>.py and exposes render(context).
+# A page module is imported on its first visit, so its dependencies and module-level data
+# (meal plans, CSS, ...) are loaded once per process instead of being rebuilt on every rerun.
+PAGES = {
+    "🏠 Home": {"module": "views.home", "icon": "house"},
+    "🩺 Disease Prediction": {"module": "views.disease", "icon": "stethoscope"},
+    "💪 Fitness Tracking": {"module": "views.fitness", "icon": "activity"},
+    "🧠 Mental Health": {"module": "views.mental_health", "icon": "brain"},
+    "🥗 Nutrition Guidance": {"module": "views.nutrition", "icon": "emoji-food-beverage"},
+    "🤖 AI Assistant": {"module": "views.ai_assistant", "icon": "robot"},
+}
+
+_stats = defaultdict(lambda: {"renders": 0, "render_ms": 0.0, "last_ms": 0.0, "max_ms": 0.0, "import_ms": 0.0})
+_stats_lock = threading.Lock()
+
+
+def render(page, context):
+    """Import the page module if needed and render it, recording import and render times."""
+    module_name = PAGES[page]["module"]
+    first_visit = module_name not in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    imported = time.perf_counter()
+    module.render(context)
+    elapsed_ms = (time.perf_counter() - imported) * 1000
+
+    with _stats_lock:
+        stats = _stats[page]
+        if first_visit:
+            stats["import_ms"] = (imported - start) * 1000
+        stats["renders"] += 1
+        stats["render_ms"] += elapsed_ms
+        stats["last_ms"] = elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+def render_stats():
+    """Per-page render counts and times, slowest page first."""
+    import pandas as pd
+
+    with _stats_lock:
+        rows = [
+            {"page": page, "renders": s["renders"], "mean_render_ms": s["render_ms"] / s["renders"],
+             "last_render_ms": s["last_ms"], "max_render_ms": s["max_ms"], "import_ms": s["import_ms"]}
+            for page, s in _stats.items() if s["renders"]
+        ]
+    frame = pd.DataFrame(rows, columns=["page", "renders", "mean_render_ms", "last_render_ms", "max_render_ms",
+                                        "import_ms"])
+    return frame.sort_values("mean_render_ms", ascending=False).round(1)
@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+
+
+# Declarative input schema of each disease model: feature names in training order, with the
+# type, accepted range and categorical encoding of each. The Disease Prediction forms are
+# generated from it, API and form inputs are validated against it, and Schema.encode turns
+# whole DataFrames into the model matrix one column at a time.
+# Categorical features list their form labels in display order with the code the model was
+# trained on; aliases cover the string codes found in uploads and the raw datasets.
+# Ranges are those of the training data: anything the model was trained on is accepted.
+
+
+class SchemaError(ValueError):
+    pass
+
+
+class Feature:
+    """One model input: column name, form label, type ("int", "float" or "category") and range."""
+
+    def __init__(self, name, label, dtype="float", min=None, max=None, step=None, format=None, categories=None,
+                 aliases=None, widget="radio", imputed=False):
+        self.name = name
+        self.label = label
+        self.dtype = "category" if categories else dtype
+        self.min = min
+        self.max = max
+        self.step = step
+        self.format = format
+        self.categories = categories or {}
+        self.widget = widget
+        # The dataset filled missing values of this category with its mean: values between the codes are accepted
+        self.imputed = imputed
+        # Upper-cased labels and aliases -> code, for string-valued columns
+        self.lookup = {str(k).upper(): v for k, v in {**self.categories, **(aliases or {})}.items()}
+
+    @property
+    def default(self):
+        if self.categories:
+            return next(iter(self.categories.values()))
+        value = self.min if self.min is not None else 0
+        return int(value) if self.dtype == "int" else float(value)
+
+    def encode(self, values, errors="raise"):
+        """A column of raw values (numbers, numeric strings or category labels) as float32.
+
+        Unknown labels and unparsable values raise SchemaError, or become NaN with errors="coerce".
+        """
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            return values.to_numpy(dtype=np.float32, na_value=np.nan)
+        text = values.astype("string").str.strip()
+        codes = text.str.upper().map(self.lookup) if self.lookup else pd.Series(np.nan, index=values.index)
+        codes = codes.astype("Float64").fillna(pd.to_numeric(text, errors="coerce"))
+        unknown = text[codes.isna() & text.notna() & (text != "")]
+        if len(unknown) and errors != "coerce":
+            raise SchemaError(f"Unknown {self.name} value(s): {', '.join(map(str, unknown.unique()[:5]))}")
+        return codes.to_numpy(dtype=np.float32, na_value=np.nan)
+
+    def encode_value(self, value):
+        """One raw value as a float, through a plain dict lookup: the per-record path of API requests."""
+        if not isinstance(value, str):
+            return np.nan if value is None else float(value)
+        text = value.strip()
+        if not text:
+            return np.nan
+        code = self.lookup.get(text.upper())
+        if code is not None:
+            return float(code)
+        try:
+            return float(text)
+        except ValueError:
+            raise SchemaError(f"Unknown {self.name} value(s): {text}")
+
+    def invalid(self, column):
+        """Mask of values the form would not accept: missing, out of range or not a category code."""
+        bad = np.isnan(column)
+        if self.categories and self.imputed:
+            codes = list(self.categories.values())
+            bad |= (column < min(codes)) | (column > max(codes))
+        elif self.categories:
+            bad |= ~np.isin(column, list(self.categories.values()))
+        if self.min is not None:
+            bad |= column < self.min
+        if self.max is not None:
+            bad |= column > self.max
+        return bad
+
+    def describe(self):
+        if self.categories:
+            codes = " or ".join(f"{code} ({label})" for label, code in self.categories.items())
+            return f"{codes}, or a value between them" if self.imputed else codes
+        if self.min is not None and self.max is not None:
+            return f"between {self.min} and {self.max}"
+        if self.min is not None:
+            return f"at least {self.min}"
+        if self.max is not None:
+            return f"at most {self.max}"
+        return "a number"
+
+
+class Schema:
+    """Ordered features of one model, plus the number of form columns they are laid out in."""
+
+    def __init__(self, features, columns=2):
+        self.features = features
+        self.columns = columns
+        self.names = [f.name for f in features]
+
+    def encode(self, df, errors="raise"):
+        """Encode a DataFrame whose columns are the feature names into the float32 model matrix."""
+        matrix = np.empty((len(df), len(self.features)), dtype=np.float32)
+        for i, feature in enumerate(self.features):
+            matrix[:, i] = feature.encode(df[feature.name], errors)
+        return matrix
+
+    def encode_record(self, values):
+        """One record's raw values, in feature order, as a float32 model row."""
+        return np.array([feature.encode_value(value) for feature, value in zip(self.features, values)],
+                        dtype=np.float32)
+
+    def validate(self, matrix):
+        """One message per feature with rejected values; empty when every row is valid."""
+        errors = []
+        for i, feature in enumerate(self.features):
+            rows = np.flatnonzero(feature.invalid(matrix[:, i]))
+            if len(rows):
+                where = f" (row {rows[0] + 1})" if len(matrix) > 1 else ""
+                errors.append(f"{feature.name} must be {feature.describe()}{where}")
+        return errors
+
+    def row_errors(self, matrix):
+        """Per-row message naming every rejected feature; an empty string for valid rows."""
+        errors = np.full(len(matrix), "", dtype=object)
+        for i, feature in enumerate(self.features):
+            bad = feature.invalid(matrix[:, i])
+            if bad.any():
+                message = f"{feature.name} must be {feature.describe()}"
+                errors[bad] = np.where(errors[bad] == "", message, errors[bad] + "; " + message)
+        return errors
+
+    def form_columns(self):
+        """Features split into consecutive, evenly sized groups, one per form column."""
+        size = -(-len(self.features) // self.columns)
+        return [self.features[i:i + size] for i in range(0, len(self.features), size)]
+
+
+NO_YES = {"No": 0, "Yes": 1}
+MALE_FEMALE = {"Male": 1, "Female": 0}
+
+
+def _lung_symptom(name, label):
+    # The lung cancer survey codes every yes/no answer as 1 = no, 2 = yes
+    return Feature(name, label, categories={"No": 1, "Yes": 2})
+
+
+SCHEMAS = {
+    "diabetes": Schema([
+        Feature("Pregnancies", "Number of Pregnancies", "int", min=0),
+        Feature("Glucose", "Glucose Level", "int", min=0),
+        Feature("BloodPressure", "Blood Pressure", "int", min=0),
+        Feature("SkinThickness", "Skin Thickness", "int", min=0),
+        Feature("Insulin", "Insulin Level", "int", min=0),
+        Feature("BMI", "BMI", min=0.0),
+        Feature("DiabetesPedigreeFunction", "Diabetes Pedigree Function", min=0.0),
+        Feature("Age", "Age", "int", min=0, max=120),
+    ]),
+    "heart_disease": Schema([
+        Feature("age", "Age", "int", min=0, max=120),
+        Feature("sex", "Sex", categories=MALE_FEMALE),
+        Feature("cp", "Chest Pain Type (0-3)", "int", min=0, max=3),
+        Feature("trestbps", "Resting Blood Pressure (mm Hg)", "int", min=0),
+        Feature("chol", "Serum Cholesterol (mg/dl)", "int", min=0),
+        Feature("fbs", "Fasting Blood Sugar > 120 mg/dl", categories=NO_YES),
+        Feature("restecg", "Resting ECG Results (0-2)", "int", min=0, max=2),
+        Feature("thalach", "Maximum Heart Rate Achieved", "int", min=0),
+        Feature("exang", "Exercise Induced Angina", categories=NO_YES),
+        Feature("oldpeak", "ST Depression Induced by Exercise", min=0.0, step=0.1),
+        Feature("slope", "Slope of the Peak Exercise ST Segment (0-2)", "int", min=0, max=2),
+        Feature("ca", "Number of Major Vessels Colored by Fluoroscopy (0-4)", "int", min=0, max=4),
+        # 0 marks an unrecorded result in the dataset
+        Feature("thal", "Thalassemia (0-3: 1 = normal, 2 = fixed defect, 3 = reversible defect)", "int", min=0, max=3),
+    ]),
+    "lung_cancer": Schema([
+        Feature("GENDER", "Gender", categories=MALE_FEMALE, aliases={"M": 1, "F": 0}),
+        Feature("AGE", "Age", "int", min=0, max=120),
+        _lung_symptom("SMOKING", "Smoking?"),
+        _lung_symptom("YELLOW_FINGERS", "Yellow Fingers?"),
+        _lung_symptom("ANXIETY", "Anxiety?"),
+        _lung_symptom("PEER_PRESSURE", "Peer Pressure?"),
+        _lung_symptom("CHRONIC DISEASE", "Chronic Disease?"),
+        _lung_symptom("FATIGUE", "Fatigue?"),
+        _lung_symptom("ALLERGY", "Allergy?"),
+        _lung_symptom("WHEEZING", "Wheezing?"),
+        _lung_symptom("ALCOHOL CONSUMING", "Alcohol Consumption?"),
+        _lung_symptom("COUGHING", "Coughing?"),
+        _lung_symptom("SHORTNESS OF BREATH", "Shortness of Breath?"),
+        _lung_symptom("SWALLOWING DIFFICULTY", "Swallowing Difficulty?"),
+        _lung_symptom("CHEST PAIN", "Chest Pain?"),
+    ]),
+    "parkinsons": Schema([
+        Feature("MDVP:Fo(Hz)", "MDVP:Fo (Hz)", min=0.0),
+        Feature("MDVP:Fhi(Hz)", "MDVP:Fhi (Hz)", min=0.0),
+        Feature("MDVP:Flo(Hz)", "MDVP:Flo (Hz)", min=0.0),
+        Feature("MDVP:Jitter(%)", "MDVP:Jitter (%)", min=0.0),
+        Feature("MDVP:Jitter(Abs)", "MDVP:Jitter (Abs)", min=0.0),
+        Feature("MDVP:RAP", "MDVP:RAP", min=0.0),
+        Feature("MDVP:PPQ", "MDVP:PPQ", min=0.0),
+        Feature("Jitter:DDP", "Jitter:DDP", min=0.0),
+        Feature("MDVP:Shimmer", "MDVP:Shimmer", min=0.0),
+        Feature("MDVP:Shimmer(dB)", "MDVP:Shimmer (dB)", min=0.0),
+        Feature("Shimmer:APQ3", "Shimmer:APQ3", min=0.0),
+        Feature("Shimmer:APQ5", "Shimmer:APQ5", min=0.0),
+        Feature("MDVP:APQ", "MDVP:APQ", min=0.0),
+        Feature("Shimmer:DDA", "Shimmer:DDA", min=0.0),
+        Feature("NHR", "NHR", min=0.0),
+        Feature("HNR", "HNR", min=0.0),
+        Feature("RPDE", "RPDE", min=0.0),
+        Feature("DFA", "DFA", min=0.0),
+        # Negative in every recording of the dataset
+        Feature("spread1", "Spread1", max=0.0),
+        Feature("spread2", "Spread2", min=0.0),
+        Feature("D2", "D2", min=0.0),
+        Feature("PPE", "PPE", min=0.0),
+    ], columns=3),
+    "hypo_thyroid": Schema([
+        # No upper bound: the dataset has a recorded age of 455
+        Feature("age", "Age", "int", min=0),
+        # Missing sexes were filled with the mean (0.6847)
+        Feature("sex", "Sex", categories={"Female": 0, "Male": 1}, widget="selectbox", imputed=True),
+        Feature("on thyroxine", "On Thyroxine?", categories=NO_YES),
+        Feature("TSH", "TSH Level", min=0.0, format="%.2f"),
+        Feature("T3 measured", "T3 Measured?", categories=NO_YES),
+        Feature("T3", "T3 Level", min=0.0, format="%.2f"),
+        Feature("TT4", "TT4 Level", min=0.0, format="%.2f"),
+    ]),
+}
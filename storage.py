@@ -0,0 +1,413 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+# All user logs live in one SQLite database in WAL mode: readers never block the
+# writer, and every write is a small indexed transaction instead of a CSV rewrite.
+DB_PATH = os.environ.get("HEALTHAPP_DB", "health_logs.db")
+
+
+def open_connection(path=DB_PATH):
+    """A connection in WAL mode, for callers that keep one open (e.g. a background writer)."""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+@contextmanager
+def connect(path=DB_PATH):
+    # One short-lived connection per operation keeps Streamlit's session threads independent
+    conn = open_connection(path)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _claim_migration(conn, name):
+    # Marker row written in the caller's transaction, so only one process ever imports a legacy
+    # file: a concurrent importer blocks on the write lock, then finds the marker and skips
+    conn.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY, migrated_at TEXT NOT NULL)")
+    return conn.execute("INSERT OR IGNORE INTO migrations (name, migrated_at) VALUES (?, datetime('now'))",
+                        (name,)).rowcount == 1
+
+
+def _retire(csv_path):
+    # Another process may have renamed it already
+    try:
+        os.replace(csv_path, csv_path + ".migrated")
+    except FileNotFoundError:
+        pass
+
+
+class FitnessStore:
+    """Workout log with indexed lookups by date and exercise.
+
+    Per-day totals and per-exercise counts are maintained by triggers on every log and
+    delete, so the trend charts read small aggregates instead of the whole log.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        with connect(self.path) as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS workouts (
+                    id INTEGER PRIMARY KEY,
+                    date TEXT NOT NULL,
+                    exercise TEXT NOT NULL,
+                    duration INTEGER NOT NULL,
+                    calories INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS workouts_date_exercise ON workouts (date, exercise);
+                CREATE INDEX IF NOT EXISTS workouts_exercise ON workouts (exercise);
+
+                CREATE TABLE IF NOT EXISTS workout_daily (
+                    date TEXT PRIMARY KEY,
+                    calories INTEGER NOT NULL,
+                    minutes INTEGER NOT NULL,
+                    sessions INTEGER NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS workout_exercise (
+                    exercise TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TRIGGER IF NOT EXISTS workouts_rollup_insert AFTER INSERT ON workouts BEGIN
+                    INSERT INTO workout_daily (date, calories, minutes, sessions)
+                    VALUES (NEW.date, NEW.calories, NEW.duration, 1)
+                    ON CONFLICT (date) DO UPDATE SET calories = calories + excluded.calories,
+                        minutes = minutes + excluded.minutes, sessions = sessions + 1;
+                    INSERT INTO workout_exercise (exercise, count) VALUES (NEW.exercise, 1)
+                    ON CONFLICT (exercise) DO UPDATE SET count = count + 1;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS workouts_rollup_delete AFTER DELETE ON workouts BEGIN
+                    UPDATE workout_daily SET calories = calories - OLD.calories, minutes = minutes - OLD.duration,
+                        sessions = sessions - 1
+                    WHERE date = OLD.date;
+                    DELETE FROM workout_daily WHERE date = OLD.date AND sessions <= 0;
+                    UPDATE workout_exercise SET count = count - 1 WHERE exercise = OLD.exercise;
+                    DELETE FROM workout_exercise WHERE exercise = OLD.exercise AND count <= 0;
+                END;
+            """)
+
+            # Databases created before the rollups existed get them backfilled once
+            if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM workout_daily) AND EXISTS (SELECT 1 FROM workouts)"
+                            ).fetchone()[0]:
+                conn.executescript("""
+                    INSERT INTO workout_daily (date, calories, minutes, sessions)
+                    SELECT date, SUM(calories), SUM(duration), COUNT(*) FROM workouts GROUP BY date;
+                    INSERT INTO workout_exercise (exercise, count)
+                    SELECT exercise, COUNT(*) FROM workouts GROUP BY exercise;
+                """)
+
+    def migrate_csv(self, csv_path):
+        """Import a legacy fitness_logs.csv once, then rename it so it is never read again."""
+        if not os.path.exists(csv_path):
+            return 0
+        legacy = pd.read_csv(csv_path)
+        rows = [
+            (str(pd.to_datetime(r["Date"]).date()), str(r["Exercise"]), int(r["Duration (min)"]),
+             int(r["Calories Burned"]))
+            for _, r in legacy.dropna(subset=["Date", "Exercise"]).iterrows()
+        ]
+        with connect(self.path) as conn:
+            if not _claim_migration(conn, f"workouts:{os.path.basename(csv_path)}"):
+                return 0
+            conn.executemany("INSERT INTO workouts (date, exercise, duration, calories) VALUES (?, ?, ?, ?)", rows)
+        _retire(csv_path)
+        return len(rows)
+
+    def log(self, date, exercise, duration, calories):
+        with connect(self.path) as conn:
+            conn.execute("INSERT INTO workouts (date, exercise, duration, calories) VALUES (?, ?, ?, ?)",
+                         (str(date), exercise, int(duration), int(calories)))
+
+    def delete(self, date, exercise):
+        # Returns the number of workouts removed
+        with connect(self.path) as conn:
+            return conn.execute("DELETE FROM workouts WHERE date = ? AND exercise = ?",
+                                (str(date), exercise)).rowcount
+
+    def clear(self):
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM workouts")
+
+    def find(self, date=None, exercise=None):
+        clauses, params = [], []
+        if date is not None:
+            clauses.append("date = ?")
+            params.append(str(date))
+        if exercise is not None:
+            clauses.append("exercise = ?")
+            params.append(exercise)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(f"{where} ORDER BY date DESC, id DESC", params)
+
+    def history(self, start=None, end=None, limit=None, offset=0):
+        """Workouts between start and end (inclusive), newest first, one page of limit rows at a time."""
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(str(start))
+        if end is not None:
+            clauses.append("date <= ?")
+            params.append(str(end))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        page = ""
+        if limit is not None:
+            page = " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        return self._query(f"{where} ORDER BY date DESC, id DESC{page}", params)
+
+    def count(self, start=None, end=None):
+        # Number of workouts between start and end, summed from the daily rollup
+        with connect(self.path) as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(sessions), 0) FROM workout_daily WHERE date BETWEEN ? AND ?",
+                (str(start or "0000-01-01"), str(end or "9999-12-31"))
+            ).fetchone()[0]
+
+    def date_bounds(self):
+        # (first, last) workout date, or None when nothing is logged
+        with connect(self.path) as conn:
+            first, last = conn.execute("SELECT MIN(date), MAX(date) FROM workout_daily").fetchone()
+        if first is None:
+            return None
+        return pd.Timestamp(first).date(), pd.Timestamp(last).date()
+
+    def daily_totals(self, start, end):
+        """Calories, minutes and sessions per day between start and end (inclusive)."""
+        with connect(self.path) as conn:
+            daily = pd.read_sql_query(
+                "SELECT date, calories, minutes, sessions FROM workout_daily WHERE date BETWEEN ? AND ? ORDER BY date",
+                conn, params=(str(start), str(end))
+            )
+        daily["date"] = pd.to_datetime(daily["date"])
+        return daily.set_index("date")
+
+    def period_totals(self, start, end, period):
+        """Totals per week ("W", starting Monday) or month ("M") from the daily rollup."""
+        daily = self.daily_totals(start, end)
+        if daily.empty:
+            return daily
+        return daily.resample("W-SUN" if period == "W" else "MS").sum()
+
+    def exercise_counts(self):
+        with connect(self.path) as conn:
+            rows = conn.execute("SELECT exercise, count FROM workout_exercise ORDER BY count DESC").fetchall()
+        return pd.Series(dict(rows), dtype="int64")
+
+    def _query(self, suffix, params=()):
+        with connect(self.path) as conn:
+            return pd.read_sql_query(
+                "SELECT date AS \"Date\", exercise AS \"Exercise\", duration AS \"Duration (min)\", "
+                f"calories AS \"Calories Burned\" FROM workouts {suffix}",
+                conn, params=params
+            )
+
+
+# Score of each mood on the calendar heatmap
+MOOD_SCORES = {"😊 Happy": 5, "😞 Sad": 2, "😰 Stressed": 1, "😟 Anxious": 2, "😌 Relaxed": 4}
+
+
+class MoodStore:
+    """Mood log partitioned by user, with one entry per user, date and mood.
+
+    Daily score and monthly per-mood count rollups are maintained by triggers in the
+    same transaction as each insert or delete, so charts never rescan the history.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        with connect(self.path) as conn:
+            # The primary key doubles as the uniqueness index that replaces the duplicate scan
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS moods (
+                    user TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    mood TEXT NOT NULL,
+                    PRIMARY KEY (user, date, mood)
+                ) WITHOUT ROWID;
+
+                -- Last visit of each user, for expiring anonymous histories
+                CREATE TABLE IF NOT EXISTS mood_users (
+                    user TEXT PRIMARY KEY,
+                    last_seen TEXT NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS mood_scores (
+                    mood TEXT PRIMARY KEY,
+                    score INTEGER NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS mood_daily (
+                    user TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    PRIMARY KEY (user, date)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS mood_monthly (
+                    user TEXT NOT NULL,
+                    month TEXT NOT NULL,
+                    mood TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (user, month, mood)
+                ) WITHOUT ROWID;
+
+                CREATE TRIGGER IF NOT EXISTS moods_rollup_insert AFTER INSERT ON moods BEGIN
+                    INSERT INTO mood_daily (user, date, score)
+                    VALUES (NEW.user, NEW.date, COALESCE((SELECT score FROM mood_scores WHERE mood = NEW.mood), 0))
+                    ON CONFLICT (user, date) DO UPDATE SET score = score + excluded.score;
+                    INSERT INTO mood_monthly (user, month, mood, count)
+                    VALUES (NEW.user, substr(NEW.date, 1, 7), NEW.mood, 1)
+                    ON CONFLICT (user, month, mood) DO UPDATE SET count = count + 1;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS moods_rollup_delete AFTER DELETE ON moods BEGIN
+                    UPDATE mood_daily
+                    SET score = score - COALESCE((SELECT score FROM mood_scores WHERE mood = OLD.mood), 0)
+                    WHERE user = OLD.user AND date = OLD.date;
+                    UPDATE mood_monthly SET count = count - 1
+                    WHERE user = OLD.user AND month = substr(OLD.date, 1, 7) AND mood = OLD.mood;
+                    DELETE FROM mood_monthly WHERE user = OLD.user AND month = substr(OLD.date, 1, 7) AND count <= 0;
+                END;
+            """)
+            conn.executemany("INSERT OR REPLACE INTO mood_scores (mood, score) VALUES (?, ?)", MOOD_SCORES.items())
+
+            # Databases created before the rollups existed get them backfilled once
+            if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM mood_monthly) AND EXISTS (SELECT 1 FROM moods)"
+                            ).fetchone()[0]:
+                self._rebuild_rollups(conn)
+
+    def _rebuild_rollups(self, conn):
+        conn.executescript("""
+            DELETE FROM mood_daily;
+            DELETE FROM mood_monthly;
+            INSERT INTO mood_daily (user, date, score)
+            SELECT m.user, m.date, SUM(COALESCE(s.score, 0))
+            FROM moods m LEFT JOIN mood_scores s ON s.mood = m.mood
+            GROUP BY m.user, m.date;
+            INSERT INTO mood_monthly (user, month, mood, count)
+            SELECT user, substr(date, 1, 7), mood, COUNT(*) FROM moods GROUP BY user, substr(date, 1, 7), mood;
+        """)
+
+    def log(self, user, date, mood):
+        # Returns False if this mood was already logged for that user and date
+        with connect(self.path) as conn:
+            return conn.execute("INSERT OR IGNORE INTO moods (user, date, mood) VALUES (?, ?, ?)",
+                                (user, str(date), mood)).rowcount == 1
+
+    def bulk_import(self, rows):
+        """Insert many (user, date, mood) rows in one transaction, skipping duplicates."""
+        with connect(self.path) as conn:
+            return self._insert(conn, rows)
+
+    @staticmethod
+    def _insert(conn, rows):
+        # rowcount, unlike total_changes, leaves out the rollup rows the triggers write
+        return conn.executemany("INSERT OR IGNORE INTO moods (user, date, mood) VALUES (?, ?, ?)",
+                                ((user, str(date), mood) for user, date, mood in rows)).rowcount
+
+    @staticmethod
+    def _frame_rows(user, frame):
+        if not {"Date", "Mood"} <= set(frame.columns):
+            raise ValueError("Mood history needs Date and Mood columns")
+        dates = pd.to_datetime(frame["Date"], errors="coerce").dt.date
+        return [(user, date, mood) for date, mood in zip(dates, frame["Mood"]) if not pd.isna(date)]
+
+    def import_frame(self, user, frame):
+        """Import a DataFrame with Date and Mood columns for one user."""
+        return self.bulk_import(self._frame_rows(user, frame))
+
+    def migrate_csv(self, csv_path, user):
+        """Import a legacy mood_logs.csv once for the given user, then rename it."""
+        if not os.path.exists(csv_path):
+            return 0
+        legacy = pd.read_csv(csv_path)
+        with connect(self.path) as conn:
+            if not _claim_migration(conn, f"moods:{os.path.basename(csv_path)}"):
+                return 0
+            imported = self._insert(conn, self._frame_rows(user, legacy)) if "Date" in legacy.columns else 0
+        _retire(csv_path)
+        return imported
+
+    def has_history(self, user):
+        with connect(self.path) as conn:
+            return conn.execute("SELECT EXISTS (SELECT 1 FROM moods WHERE user = ?)", (user,)).fetchone()[0] == 1
+
+    def claim(self, from_user, to_user):
+        """Move every entry of from_user to to_user in one transaction; returns the entries moved.
+
+        A concurrent second claim finds nothing left to move. Rollups follow through the triggers.
+        """
+        with connect(self.path) as conn:
+            moved = self._insert(conn, conn.execute(
+                "SELECT ?, date, mood FROM moods WHERE user = ?", (to_user, from_user)).fetchall())
+            conn.execute("DELETE FROM moods WHERE user = ?", (from_user,))
+            conn.execute("DELETE FROM mood_daily WHERE user = ?", (from_user,))
+        return moved
+
+    def touch(self, user):
+        # Records today's visit; anonymous histories expire a while after their last one
+        with connect(self.path) as conn:
+            conn.execute("INSERT OR REPLACE INTO mood_users (user, last_seen) VALUES (?, date('now'))", (user,))
+
+    def purge_inactive(self, prefixes, days):
+        """Delete the histories of users with one of the ID prefixes not seen for the given days."""
+        with connect(self.path) as conn:
+            stale = [user for (user,) in conn.execute(
+                "SELECT DISTINCT m.user FROM moods m LEFT JOIN mood_users u ON u.user = m.user "
+                "WHERE u.last_seen IS NULL OR u.last_seen < date('now', ?)", (f"-{int(days)} days",)
+            ).fetchall() if user.startswith(tuple(prefixes))]
+            for user in stale:
+                conn.execute("DELETE FROM moods WHERE user = ?", (user,))
+                conn.execute("DELETE FROM mood_daily WHERE user = ?", (user,))
+                conn.execute("DELETE FROM mood_users WHERE user = ?", (user,))
+        return len(stale)
+
+    def history(self, user):
+        with connect(self.path) as conn:
+            return pd.read_sql_query(
+                "SELECT date AS \"Date\", mood AS \"Mood\" FROM moods WHERE user = ? ORDER BY date DESC",
+                conn, params=(user,)
+            )
+
+    def clear(self, user):
+        with connect(self.path) as conn:
+            conn.execute("DELETE FROM moods WHERE user = ?", (user,))
+            conn.execute("DELETE FROM mood_daily WHERE user = ?", (user,))
+
+    def years(self, user):
+        # Years with at least one logged mood, newest first
+        with connect(self.path) as conn:
+            return [int(year) for (year,) in conn.execute(
+                "SELECT DISTINCT substr(month, 1, 4) FROM mood_monthly WHERE user = ? ORDER BY 1 DESC", (user,)
+            )]
+
+    def daily_scores(self, user, year):
+        """Mood score per day of one year, read from the daily rollup."""
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT date, score FROM mood_daily WHERE user = ? AND date >= ? AND date < ? AND score != 0",
+                (user, f"{year}-01-01", f"{year + 1}-01-01")
+            ).fetchall()
+        return pd.Series({pd.Timestamp(date): score for date, score in rows}, dtype="int64")
+
+    def mood_counts(self, user, year=None):
+        """How often each mood was logged, from the monthly rollup (all years by default)."""
+        query = "SELECT mood, SUM(count) FROM mood_monthly WHERE user = ?"
+        params = [user]
+        if year is not None:
+            query += " AND month >= ? AND month < ?"
+            params += [f"{year}-01", f"{year + 1}-01"]
+        with connect(self.path) as conn:
+            rows = conn.execute(query + " GROUP BY mood ORDER BY 2 DESC", params).fetchall()
+        return pd.Series(dict(rows), dtype="int64")
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batching import MicroBatcher  # noqa: E402
+
+
+def double(X):
+    return X[:, 0] * 2
+
+
+@pytest.fixture(params=[False, True], ids=["collector-thread", "executor"])
+def executor(request):
+    if not request.param:
+        yield None
+        return
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_cancelled_future_does_not_strand_the_batch(executor):
+    # A long window keeps all three rows in one batch
+    batcher = MicroBatcher(double, max_wait_ms=200, max_batch_size=3, executor=executor)
+    try:
+        f1 = batcher.submit([1.0])
+        f2 = batcher.submit([2.0])
+        # Cancelled before the third row fills the batch, so before it is scored
+        assert f2.cancel()
+        f3 = batcher.submit([3.0])
+        assert f1.result(timeout=5) == 2.0
+        assert f3.result(timeout=5) == 6.0
+        assert f2.cancelled()
+
+        # The batcher keeps serving afterwards
+        assert batcher.submit([4.0]).result(timeout=5) == 8.0
+        assert batcher._thread.is_alive()
+    finally:
+        batcher.close()
+
+
+def test_fully_cancelled_batch_is_skipped(executor):
+    calls = []
+    batcher = MicroBatcher(lambda X: calls.append(len(X)) or double(X), max_wait_ms=50, max_batch_size=2,
+                           executor=executor)
+    try:
+        future = batcher.submit([1.0])
+        assert future.cancel()
+        time.sleep(0.1)
+        assert batcher.submit([5.0]).result(timeout=5) == 10.0
+        assert calls == [1]
+    finally:
+        batcher.close()
+
+
+def test_predict_error_reaches_every_caller(executor):
+    def fail(X):
+        raise ValueError("bad batch")
+
+    batcher = MicroBatcher(fail, max_wait_ms=100, max_batch_size=2, executor=executor)
+    try:
+        futures = [batcher.submit([1.0]), batcher.submit([2.0])]
+        for future in futures:
+            with pytest.raises(ValueError, match="bad batch"):
+                future.result(timeout=5)
+        assert batcher._thread.is_alive()
+    finally:
+        batcher.close()
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import inference  # noqa: E402
+from schemas import SCHEMAS  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    # Dataset paths are relative to the repository root
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.mark.parametrize("key", list(SCHEMAS))
+def test_training_data_passes_its_schema(key):
+    # Every row a model was trained on must be accepted by the forms, the API and batch uploads
+    import pandas as pd
+
+    df = pd.read_csv(inference.DISEASES[key]["dataset"], encoding="utf-8-sig")
+    matrix = inference.to_matrix(key, df)
+    assert SCHEMAS[key].validate(matrix) == []
+    assert (SCHEMAS[key].row_errors(matrix) == "").all()
+
+
+def test_out_of_range_values_are_rejected():
+    row = [0.0] * len(SCHEMAS["heart_disease"].names)
+    row[SCHEMAS["heart_disease"].names.index("thal")] = 4
+    with pytest.raises(inference.SchemaError, match="thal"):
+        inference.records_to_matrix("heart_disease", [row])
+
+
+def test_record_path_matches_vectorized_encoder():
+    import pandas as pd
+
+    record = ["M", 69, "Yes", "No", "No", "Yes", "No", "Yes", "No", "Yes", "Yes", "Yes", "Yes", "Yes", "Yes"]
+    schema = SCHEMAS["lung_cancer"]
+    vectorized = schema.encode(pd.DataFrame([record], columns=schema.names, dtype=object))
+    np.testing.assert_array_equal(inference.records_to_matrix("lung_cancer", [record]), vectorized)
+
+
+def test_dict_records_are_picked_in_feature_order():
+    names = SCHEMAS["diabetes"].names
+    values = [6, 148, 72, 35, 0, 33.6, 0.627, 50]
+    # Reversed field order and a stray BOM/space in a name, as EHR payloads send them
+    record = {(f"\ufeff{name} " if name == "Glucose" else name): value
+              for name, value in reversed(list(zip(names, values)))}
+    np.testing.assert_array_equal(inference.records_to_matrix("diabetes", [record]),
+                                  inference.records_to_matrix("diabetes", [values]))
+    with pytest.raises(inference.SchemaError, match="Missing required columns"):
+        inference.records_to_matrix("diabetes", [{"Glucose": 148}])
+
+
+def test_upload_rejects_bad_rows_and_scores_the_rest():
+    import pandas as pd
+
+    class Model:
+        def predict_proba(self, X):
+            return np.column_stack([np.full(len(X), 0.75), np.full(len(X), 0.25)])
+
+    df = pd.read_csv(inference.DISEASES["diabetes"]["dataset"], encoding="utf-8-sig").head(4).astype(object)
+    df.loc[1, "Glucose"] = "abc"
+    df.loc[2, "Age"] = -1
+    scored = pd.concat(inference.score_chunks(Model(), "diabetes", [df]))
+    assert scored["error"].ne("").tolist() == [False, True, True, False]
+    assert "Glucose" in scored.loc[1, "error"] and "Age" in scored.loc[2, "error"]
+    assert scored["probability"].isna().tolist() == [False, True, True, False]
+    assert scored["prediction"].isna().tolist() == [False, True, True, False]
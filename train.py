@@ -0,0 +1,282 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import calibration
+import datasets
+import inference
+from model_registry import MODEL_PATHS, VERSIONS_DIR, file_hash
+
+
+# Scripted replacement for the Training/*-model-making.ipynb notebooks. Trains any or all
+# disease models from Datasets/ with the notebooks' split and (by default) their two-stage
+# XGBoost grid search, running each search across cores and, optionally, the diseases in parallel processes:
+#   python train.py                          # every disease, one after another
+#   python train.py diabetes --n-jobs 8
+#   python train.py --search tpe             # joint search instead of the two staged grids
+#   python train.py --processes 5 --promote
+# Each run writes Models/versions/<disease>/<version>/ with model.joblib and metadata.json;
+# --promote also replaces the model the app and API load; running processes pick it up
+# without a restart (see model_registry.py).
+CV_FOLDS = 5
+SCORING = "accuracy"
+SEED = 42
+
+# The notebooks' stage 1 and stage 2 grids. Stage 2 starts from the best stage 1 parameters
+# instead of values copied over by hand.
+GRID_STAGES = [
+    {"learning_rate": [0.01, 0.05, 0.1, 0.2], "subsample": [0.6, 0.8, 1.0], "colsample_bytree": [0.6, 0.8, 1.0],
+     "n_estimators": [100, 200, 300]},
+    {"max_depth": [3, 5, 7], "min_child_weight": [1, 3, 5], "gamma": [0, 0.1, 0.3, 0.5]},
+]
+
+# Joint-space searches cover the same ranges as both grids at once:
+#   halving - successive halving over the joint grid, with boosting rounds as the resource,
+#             so weak candidates are dropped after a few trees
+#   tpe     - Optuna's TPE sampler over continuous ranges; each trial is one xgboost.cv run
+#             that stops adding trees once the validation logloss stops improving
+MAX_ESTIMATORS = 300
+HALVING_CANDIDATES = 48
+HALVING_MIN_ESTIMATORS = 30
+HALVING_FACTOR = 3
+TPE_TRIALS = 40
+EARLY_STOPPING_ROUNDS = 20
+
+
+def estimator(**params):
+    from xgboost import XGBClassifier
+
+    # One thread per fit: the parallelism comes from the search running fits side by side
+    return XGBClassifier(eval_metric="logloss", random_state=SEED, n_jobs=1, **params)
+
+
+def split(key):
+    """The notebooks' train/test split of a disease dataset, as DataFrames and label arrays."""
+    from sklearn.model_selection import train_test_split
+
+    X, y = datasets.load(key)
+    return train_test_split(X, y, test_size=calibration.HOLDOUT_SIZE, random_state=calibration.HOLDOUT_SEED)
+
+
+def grid_search(X_train, y_train, n_jobs):
+    """Staged GridSearchCV; returns (fitted best model, its params, CV accuracy, number of fits)."""
+    from sklearn.model_selection import GridSearchCV
+
+    params = {}
+    fits = 0
+    for grid in GRID_STAGES:
+        search = GridSearchCV(estimator(**params), grid, cv=CV_FOLDS, scoring=SCORING, n_jobs=n_jobs)
+        search.fit(X_train, y_train)
+        params.update(search.best_params_)
+        fits += len(search.cv_results_["params"]) * CV_FOLDS + 1
+    return search.best_estimator_, params, float(search.best_score_), fits
+
+
+def _folds():
+    # The same unshuffled stratified folds GridSearchCV uses for a classifier
+    from sklearn.model_selection import StratifiedKFold
+
+    return StratifiedKFold(CV_FOLDS)
+
+
+def _cv_accuracy(params, X_train, y_train, n_jobs):
+    # Final CV score of the chosen parameters, measured exactly like the grid search's
+    from sklearn.model_selection import cross_val_score
+
+    scores = cross_val_score(estimator(**params), X_train, y_train, cv=_folds(), scoring=SCORING, n_jobs=n_jobs)
+    return float(scores.mean())
+
+
+def halving_search(X_train, y_train, n_jobs):
+    """Successive halving over the joint grid with n_estimators as the budget."""
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingRandomSearchCV
+
+    grid = {k: v for stage in GRID_STAGES for k, v in stage.items() if k != "n_estimators"}
+    search = HalvingRandomSearchCV(
+        estimator(), grid, n_candidates=HALVING_CANDIDATES, resource="n_estimators", factor=HALVING_FACTOR,
+        min_resources=HALVING_MIN_ESTIMATORS, max_resources=MAX_ESTIMATORS, cv=_folds(), scoring=SCORING,
+        random_state=SEED, n_jobs=n_jobs,
+    )
+    search.fit(X_train, y_train)
+    fits = sum(search.n_candidates_) * CV_FOLDS + 1
+    return search.best_estimator_, dict(search.best_params_), float(search.best_score_), fits
+
+
+def tpe_search(X_train, y_train, n_jobs):
+    """Optuna TPE over the joint space, with early stopping deciding n_estimators."""
+    import optuna
+    import xgboost
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    dtrain = xgboost.DMatrix(X_train, label=y_train)
+    folds = list(_folds().split(X_train, y_train))
+    threads = os.cpu_count() if n_jobs < 0 else n_jobs
+
+    def objective(trial):
+        params = {
+            "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.2, log=True),
+            "subsample": trial.suggest_float("subsample", 0.6, 1.0),
+            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
+            "max_depth": trial.suggest_int("max_depth", 3, 7),
+            "min_child_weight": trial.suggest_int("min_child_weight", 1, 5),
+            "gamma": trial.suggest_float("gamma", 0.0, 0.5),
+        }
+        # Early stopping watches the last metric (logloss); error is read at the chosen round
+        history = xgboost.cv(dict(params, objective="binary:logistic", eval_metric=["error", "logloss"],
+                                  nthread=threads, seed=SEED),
+                             dtrain, num_boost_round=MAX_ESTIMATORS, folds=folds,
+                             early_stopping_rounds=EARLY_STOPPING_ROUNDS)
+        trial.set_user_attr("n_estimators", len(history))
+        return 1.0 - float(history["test-error-mean"].iloc[-1])
+
+    study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=SEED))
+    study.optimize(objective, n_trials=TPE_TRIALS)
+
+    params = dict(study.best_params, n_estimators=study.best_trial.user_attrs["n_estimators"])
+    cv_accuracy = _cv_accuracy(params, X_train, y_train, n_jobs)
+    model = estimator(**params).fit(X_train, y_train)
+    return model, params, cv_accuracy, (TPE_TRIALS + 1) * CV_FOLDS + 1
+
+
+SEARCHES = {"grid": grid_search, "halving": halving_search, "tpe": tpe_search}
+
+
+def dataset_hash(key):
+    return file_hash(inference.DISEASES[key]["dataset"])
+
+
+def _versions():
+    import sklearn
+    import xgboost
+
+    return {"xgboost": xgboost.__version__, "scikit-learn": sklearn.__version__, "numpy": np.__version__,
+            "pandas": pd.__version__}
+
+
+def _jsonable(params):
+    return {k: v.item() if isinstance(v, np.generic) else v for k, v in params.items()}
+
+
+def save_version(key, model, metadata, versions_dir=VERSIONS_DIR):
+    """Write the model and its metadata to a new version directory and return its path."""
+    import joblib
+
+    version = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    path = os.path.join(versions_dir, key, version)
+    suffix = 1
+    while os.path.exists(path):
+        suffix += 1
+        path = os.path.join(versions_dir, key, f"{version}-{suffix}")
+    os.makedirs(path)
+
+    model_path = os.path.join(path, "model.joblib")
+    joblib.dump(model, model_path)
+    with open(model_path, "rb") as f:
+        sha256 = hashlib.sha256(f.read()).hexdigest()
+    metadata = dict(metadata, version=os.path.basename(path), sha256=sha256)
+    with open(os.path.join(path, "metadata.json"), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return path, metadata
+
+
+def promote(key, version_path):
+    # Copy next to the live model and rename over it, so the model watcher never sees a partial file
+    target = MODEL_PATHS[key]
+    tmp = f"{target}.tmp"
+    shutil.copyfile(os.path.join(version_path, "model.joblib"), tmp)
+    os.replace(tmp, target)
+    return target
+
+
+def train(key, search="grid", n_jobs=-1, versions_dir=VERSIONS_DIR, promote_model=False):
+    """Tune, fit and save one disease model; returns its metadata."""
+    from sklearn.metrics import accuracy_score
+
+    start = time.perf_counter()
+    X_train, X_test, y_train, y_test = split(key)
+    model, params, cv_accuracy, fits = SEARCHES[search](X_train, y_train, n_jobs)
+    test_accuracy = float(accuracy_score(y_test, model.predict(X_test)))
+    wall_clock_s = time.perf_counter() - start
+
+    path, metadata = save_version(key, model, {
+        "model": key,
+        "search": search,
+        "params": _jsonable(params),
+        "cv_folds": CV_FOLDS,
+        "cv_accuracy": cv_accuracy,
+        "test_accuracy": test_accuracy,
+        "fits": fits,
+        "train_rows": len(X_train),
+        "test_rows": len(X_test),
+        "features": list(X_train.columns),
+        "dataset": inference.DISEASES[key]["dataset"],
+        "dataset_sha256": dataset_hash(key),
+        "n_jobs": n_jobs,
+        "wall_clock_s": wall_clock_s,
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "libraries": _versions(),
+    }, versions_dir)
+    metadata["path"] = path
+    if promote_model:
+        metadata["promoted_to"] = promote(key, path)
+    return metadata
+
+
+def _train_job(args):
+    key, search, n_jobs, versions_dir, promote_model = args
+    return train(key, search, n_jobs, versions_dir, promote_model)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the disease models from Datasets/")
+    parser.add_argument("models", nargs="*", help=f"models to train (default: all of {', '.join(inference.DISEASES)})")
+    parser.add_argument("--search", default="grid", choices=sorted(SEARCHES))
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel fits per search (-1: all cores)")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="diseases trained side by side; cores are shared between them")
+    parser.add_argument("--versions-dir", default=VERSIONS_DIR)
+    parser.add_argument("--promote", action="store_true", help="also replace the models the app and API load")
+    args = parser.parse_args()
+
+    unknown = [m for m in args.models if m not in inference.DISEASES]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+    keys = args.models or list(inference.DISEASES)
+
+    processes = max(1, min(args.processes, len(keys)))
+    n_jobs = args.n_jobs
+    if processes > 1:
+        cores = os.cpu_count() or 1
+        n_jobs = max(1, (cores if n_jobs < 0 else n_jobs) // processes)
+    jobs = [(key, args.search, n_jobs, args.versions_dir, args.promote) for key in keys]
+
+    start = time.perf_counter()
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_train_job, jobs))
+    else:
+        results = [_train_job(job) for job in jobs]
+    total_s = time.perf_counter() - start
+
+    df = pd.DataFrame([
+        {"model": r["model"], "search": r["search"], "fits": r["fits"], "cv_accuracy": r["cv_accuracy"],
+         "test_accuracy": r["test_accuracy"], "wall_clock_s": r["wall_clock_s"], "version": r["version"]}
+        for r in results
+    ]).set_index("model")
+    print(df.to_string(float_format=lambda v: f"{v:.4g}"))
+    print(f"\nTotal wall-clock: {total_s:.1f}s ({processes} process(es), n_jobs={n_jobs} per search)")
+    for r in results:
+        if "promoted_to" in r:
+            print(f"Promoted {r['model']} -> {r['promoted_to']}")
+
+
+if __name__ == "__main__":
+    main()
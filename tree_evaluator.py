@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+
+
+class TreeEnsemble:
+    """Pure-NumPy evaluator for a binary:logistic XGBoost tree ensemble.
+
+    Every tree is padded into one row of flat node arrays, so a whole batch is scored
+    level by level with vectorized gathers and xgboost is not needed at inference time.
+    """
+
+    ARRAYS = ("feature", "threshold", "left", "right", "default_left", "value")
+
+    def __init__(self, feature, threshold, left, right, default_left, value, base_margin, max_depth, n_features):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.value = value
+        self.base_margin = float(base_margin)
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+
+    @classmethod
+    def from_booster(cls, booster):
+        return cls.from_json(json.loads(booster.save_raw(raw_format="json")))
+
+    @classmethod
+    def from_json(cls, model):
+        learner = model["learner"]
+        objective = learner["objective"]["name"]
+        if objective != "binary:logistic":
+            raise ValueError(f"Unsupported objective: {objective}")
+        booster = learner["gradient_booster"]
+        if booster["name"] != "gbtree":
+            raise ValueError(f"Unsupported booster: {booster['name']}")
+
+        trees = booster["model"]["trees"]
+        n_trees = len(trees)
+        n_nodes = max(int(tree["tree_param"]["num_nodes"]) for tree in trees)
+
+        feature = np.zeros((n_trees, n_nodes), dtype=np.int32)
+        threshold = np.zeros((n_trees, n_nodes), dtype=np.float32)
+        left = np.full((n_trees, n_nodes), -1, dtype=np.int32)
+        right = np.full((n_trees, n_nodes), -1, dtype=np.int32)
+        default_left = np.zeros((n_trees, n_nodes), dtype=bool)
+        value = np.zeros((n_trees, n_nodes), dtype=np.float32)
+
+        for t, tree in enumerate(trees):
+            size = int(tree["tree_param"]["num_nodes"])
+            feature[t, :size] = tree["split_indices"]
+            # For leaves, split_conditions holds the leaf value
+            threshold[t, :size] = tree["split_conditions"]
+            value[t, :size] = tree["split_conditions"]
+            left[t, :size] = tree["left_children"]
+            right[t, :size] = tree["right_children"]
+            default_left[t, :size] = np.asarray(tree["default_left"], dtype=bool)
+
+        max_depth = _max_depth(left, right)
+
+        # Leaves point to themselves, so rows that reach a leaf early stay put
+        nodes = np.arange(n_nodes, dtype=np.int32)
+        is_leaf = left < 0
+        left = np.where(is_leaf, nodes, left)
+        right = np.where(is_leaf, nodes, right)
+
+        # base_score is stored in probability space ("5E-1", or "[5E-1]" since xgboost 3)
+        base_score = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+        base_margin = np.log(base_score / (1 - base_score))
+        n_features = int(learner["learner_model_param"]["num_feature"])
+        return cls(feature, threshold, left, right, default_left, value, base_margin, max_depth, n_features)
+
+    def save(self, path):
+        np.savez_compressed(path, base_margin=self.base_margin, max_depth=self.max_depth,
+                            n_features=self.n_features, **{name: getattr(self, name) for name in self.ARRAYS})
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(*(data[name] for name in cls.ARRAYS),
+                       base_margin=data["base_margin"], max_depth=data["max_depth"], n_features=data["n_features"])
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    def margin(self, X, chunk_size=4096):
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected a matrix with {self.n_features} columns, got shape {X.shape}")
+
+        out = np.empty(len(X), dtype=np.float64)
+        trees = np.arange(self.feature.shape[0])
+        # Chunk rows so the (rows x trees) node index matrix stays small
+        for start in range(0, len(X), chunk_size):
+            rows = X[start:start + chunk_size]
+            row_index = np.arange(len(rows))[:, None]
+            node = np.zeros((len(rows), len(trees)), dtype=np.int32)
+            for _ in range(self.max_depth):
+                x = rows[row_index, self.feature[trees, node]]
+                go_left = np.where(np.isnan(x), self.default_left[trees, node], x < self.threshold[trees, node])
+                node = np.where(go_left, self.left[trees, node], self.right[trees, node])
+            out[start:start + len(rows)] = self.value[trees, node].sum(axis=1, dtype=np.float64)
+        return out + self.base_margin
+
+    def predict_proba(self, X):
+        positive = 1.0 / (1.0 + np.exp(-self.margin(X)))
+        return np.column_stack([1 - positive, positive])
+
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+
+def _max_depth(left, right):
+    # Deepest root-to-leaf path over all trees; bounds the number of levels to walk
+    deepest = 0
+    for t in range(left.shape[0]):
+        stack = [(0, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if left[t, node] < 0:
+                deepest = max(deepest, depth)
+            else:
+                stack.append((left[t, node], depth + 1))
+                stack.append((right[t, node], depth + 1))
+    return deepest
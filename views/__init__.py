@@ -0,0 +1 @@
+# Pages of the Streamlit app, loaded on demand by router.py
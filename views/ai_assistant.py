@@ -0,0 +1,91 @@
+import streamlit as st
+
+from assistant import TimedStream, get_backend
+from conversation import ConversationManager
+from response_cache import ResponseCache, SEMANTIC_CACHE
+
+
+# Shared response cache (persisted across restarts)
+@st.cache_resource
+def get_response_cache(api_key):
+    embed_fn = getattr(get_backend(api_key), "embed", None) if SEMANTIC_CACHE else None
+    return ResponseCache(embed_fn=embed_fn)
+
+
+def render(context):
+    api_key = context["api_key"]
+    st.title("🤖 AI Health Chatbot")
+    st.write("💡 Ask any health-related question and get AI-powered insights instantly!")
+
+    # 🔹 Initialize chat history (bounded; older turns are kept as a rolling summary)
+    if "conversation" not in st.session_state:
+        st.session_state.conversation = ConversationManager()
+    conversation = st.session_state.conversation
+
+    response_cache = get_response_cache(api_key)
+
+    # 🔹 Display chat messages (only the most recent ones)
+    if conversation.hidden_count():
+        st.caption(f"🗂️ {conversation.hidden_count()} earlier messages are summarized and hidden")
+    for message in conversation.visible_messages():
+        with st.chat_message("assistant" if message["role"] == "assistant" else "user"):
+            st.write(message["content"])
+
+    # 🔹 User Input with Chat UI
+    if user_query := st.chat_input("Ask me anything about health..."):
+        # Build the prompt from the summary and recent turns, then append the user message to history
+        prompt = conversation.build_prompt(user_query)
+        context = conversation.last_context
+        conversation.add("user", user_query)
+
+        # Display user's message immediately
+        with st.chat_message("user"):
+            st.write(user_query)
+
+        # Stream the AI response as it is generated
+        with st.chat_message("assistant"):
+            typing_placeholder = st.empty()
+            typing_placeholder.write("🤖 AI is thinking...")
+
+            try:
+                # ⚡ Answer repeated questions from the cache; follow-ups only match the same conversation context
+                response_text = response_cache.get(user_query, context)
+                if response_text is not None:
+                    typing_placeholder.markdown(response_text)
+                    st.caption("⚡ Answered from cache")
+                else:
+                    # 🔑 One configured AI client per process, reused across messages
+                    stream = TimedStream(get_backend(api_key).stream(prompt))
+                    for _ in stream:
+                        typing_placeholder.markdown(stream.text + "▌")
+
+                    # Update AI response
+                    response_text = stream.text
+                    typing_placeholder.markdown(response_text)
+                    if stream.first_token_s is not None:
+                        st.caption(f"⏱️ First token in {stream.first_token_s:.2f}s · "
+                                   f"complete in {stream.total_s:.2f}s")
+                        response_cache.put(user_query, response_text, stream.total_s, context)
+
+                # Save AI response in history
+                conversation.add("assistant", response_text)
+
+            except Exception as e:
+                typing_placeholder.write("⚠️ API Error: Unable to generate a response.")
+                st.error(f"Error: {e}")
+
+    # 🔹 Session memory and prompt size
+    with st.expander("🧮 Conversation Memory"):
+        memory_cols = st.columns(3)
+        memory_cols[0].metric("Session Memory", f"{conversation.memory_bytes() / 1024:.1f} KB")
+        memory_cols[1].metric("Last Prompt", f"~{conversation.last_prompt_tokens} tokens")
+        memory_cols[2].metric("Summarized Messages", conversation.summarized_count)
+
+    # 🔹 Cache effectiveness
+    with st.expander("📊 Response Cache"):
+        cache_stats = response_cache.stats()
+        cache_cols = st.columns(4)
+        cache_cols[0].metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
+        cache_cols[1].metric("Hits / Misses", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        cache_cols[2].metric("Latency Saved", f"{cache_stats['latency_saved_s']:.1f}s")
+        cache_cols[3].metric("Cached Answers", f"{cache_stats['entries']} ({cache_stats['bytes'] / 1024:.0f} KB)")
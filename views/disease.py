@@ -0,0 +1,245 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+import calibration
+import charts
+import datasets
+import explanations
+import inference
+from batching import get_scheduler
+from model_registry import get_registry
+from schemas import SCHEMAS
+
+
+# Features shown in the per-patient explanation chart
+TOP_CONTRIBUTIONS = 10
+# The batching window is process-wide, so only an operator may change it from the page;
+# everyone else sees the figures read-only
+ADMIN = os.environ.get("HEALTHAPP_ADMIN") == "1"
+
+
+def feature_input(key, feature):
+    """One form widget for a schema feature; returns the value already encoded for the model."""
+    widget_key = f"{key}:{feature.name}"
+    if feature.categories:
+        widget = st.selectbox if feature.widget == "selectbox" else st.radio
+        return feature.categories[widget(feature.label, list(feature.categories), key=widget_key)]
+    return st.number_input(feature.label, min_value=feature.min, max_value=feature.max, value=feature.default,
+                           step=feature.step, format=feature.format, key=widget_key)
+
+
+def feature_form(key):
+    """The disease's input form, laid out in the schema's columns; values in model feature order."""
+    schema = SCHEMAS[key]
+    values = []
+    for column, features in zip(st.columns(schema.columns), schema.form_columns()):
+        with column:
+            values += [feature_input(key, feature) for feature in features]
+    return values
+
+
+def render(context):
+    chart_mode = context["chart_mode"]
+    st.title("Disease Prediction")
+    st.write("Select a disease and enter details for prediction.")
+
+    # Load models lazily through the shared, process-wide registry
+    model_registry = get_registry()
+    prediction_scheduler = get_scheduler()
+
+    disease = st.selectbox("Select a Disease",
+                           ["Diabetes", "Heart Disease", "Lung Cancer", "Parkinson's", "Hypo-Thyroid"])
+
+    if disease:
+        st.subheader(f"Enter details for {disease} prediction")
+        disease_key = inference.disease_key(disease)
+
+        # Widgets, their order and their encodings all come from the model's schema
+        input_data = feature_form(disease_key)
+        result_key = f"prediction:{disease_key}"
+
+        # === PREDICTION BUTTON ===
+        if st.button(f"Predict {disease}"):
+            # Load the model on first use (cached for the whole process afterwards)
+            model = model_registry.get(disease_key)
+
+            # Check the inputs against the model's schema (ranges and category codes)
+            try:
+                row = inference.records_to_matrix(disease_key, [input_data])[0]
+                input_error = None
+            except inference.SchemaError as e:
+                row, input_error = None, e
+
+            # Check if the model is loaded
+            if model is None:
+                st.session_state.pop(result_key, None)
+                st.error(f"Error: {model_registry.error(disease_key)}")
+                st.warning("⚠️ Model is not loaded! Please load the models.")
+
+            elif input_error is not None:
+                st.session_state.pop(result_key, None)
+                st.error(f"⚠️ {input_error}")
+
+            else:
+                # Perform prediction; concurrent sessions are batched into one predict_proba call
+                risk, model_version = prediction_scheduler.submit(disease_key, row).result()
+                st.session_state[result_key] = {"inputs": list(input_data), "row": row, "risk": float(risk),
+                                                "model_version": model_version}
+
+        # The result stays on screen across reruns (e.g. asking for an explanation) until the inputs change
+        prediction = st.session_state.get(result_key)
+        if prediction is not None and prediction["inputs"] == list(input_data):
+            risk = prediction["risk"]
+            calibrator = calibration.get_calibrator(disease_key)
+
+            result_col, explain_col = st.columns(2)
+            with result_col:
+                # Risk score for triage, and the per-disease decision threshold it is compared with
+                risk_cols = st.columns(2)
+                risk_cols[0].metric("Risk Score", f"{risk:.0%}")
+                risk_cols[1].metric("Decision Threshold", f"{calibrator.threshold:.0%}")
+                st.progress(min(max(risk, 0.0), 1.0))
+                if calibrator.method == "none":
+                    st.caption("ℹ️ Uncalibrated model probability (run `python calibration.py` to calibrate)")
+                model_version = prediction["model_version"]
+                st.caption(f"🧬 Model version {model_version.get('version')} · "
+                           f"sha256 {str(model_version.get('sha256'))[:12]}")
+
+                if risk >= calibrator.threshold:
+                    st.success(f"✅ **{disease} Detected**")
+                    st.warning("⚠️ Please consult a doctor for further evaluation and guidance.")
+                else:
+                    st.success(f"🟢 **No Signs of {disease} Detected**")
+                    st.info("✅ Maintain a healthy lifestyle to prevent future risks.")
+
+            with explain_col:
+                # TreeSHAP needs xgboost even when the NumPy evaluator serves predictions, so it only
+                # runs when asked for; concurrent requests are batched into one call
+                explain = st.toggle("🔍 Explain this prediction", key=f"explain:{disease_key}")
+                if explain:
+                    try:
+                        contribs, explained_version = prediction_scheduler.submit(
+                            disease_key, prediction["row"], explain=True).result()
+                    except Exception as e:
+                        explain = False
+                        st.warning(f"⚠️ Explanations are unavailable: {e}")
+                    else:
+                        if explained_version.get("sha256") != prediction["model_version"].get("sha256"):
+                            st.caption(f"ℹ️ Explained with model version {explained_version.get('version')}, "
+                                       "which replaced the one that made this prediction")
+                        # Why this patient was (not) flagged: red raises the risk, blue lowers it
+                        patient_contribs = explanations.as_series(disease_key, contribs).head(TOP_CONTRIBUTIONS)
+                        charts.contribution_chart(f"contributions_{disease_key}", patient_contribs,
+                                                  "🔍 What Drove This Prediction", "Contribution (log-odds)",
+                                                  mode=chart_mode)
+
+            if explain:
+                # Dataset-wide feature importance, computed once per model version and cached
+                with st.expander(f"📊 What Drives {disease} Predictions"):
+                    importance = explanations.global_importance(disease_key, model_registry)
+                    charts.contribution_chart(f"importance_{disease_key}", importance.head(TOP_CONTRIBUTIONS),
+                                              "Mean |Contribution| Across the Dataset", "Mean |log-odds|",
+                                              mode=chart_mode)
+
+        # === BATCH SCREENING ===
+        st.subheader(f"📂 Batch {disease} Screening")
+        batch_key = inference.disease_key(disease)
+        st.caption("Upload a CSV or Parquet file with the same columns as the training dataset: "
+                   + ", ".join(inference.DISEASES[batch_key]["features"]))
+        uploaded_file = st.file_uploader("Upload patient records", type=["csv", "parquet"], key=f"batch_{batch_key}")
+
+        if uploaded_file is not None and st.button(f"Score All {disease} Records"):
+            # The whole upload is scored by this version, and every result row names it
+            model, model_version = model_registry.current(batch_key)
+            if model is None:
+                st.error(f"Error: {model_registry.error(batch_key)}")
+            else:
+                file_format = "parquet" if uploaded_file.name.lower().endswith(".parquet") else "csv"
+                progress_bar = st.progress(0.0, text="Scoring records...")
+                # Compares the uploaded features with the (memory-mapped) training data as chunks are scored
+                drift_monitor = datasets.DriftMonitor(batch_key)
+                try:
+                    scored_bytes, scored_rows, rejected_rows = inference.score_upload(
+                        model, batch_key, uploaded_file, file_format,
+                        monitor=drift_monitor, version=model_version,
+                        progress=lambda fraction, rows: progress_bar.progress(fraction, text=f"Scored {rows:,} records")
+                    )
+                except ValueError as e:
+                    progress_bar.empty()
+                    st.error(f"⚠️ {e}")
+                else:
+                    if scored_rows == 0:
+                        st.warning("⚠️ The uploaded file has no records.")
+                    else:
+                        st.success(f"✅ Scored {scored_rows - rejected_rows:,} records with model version "
+                                   f"{model_version.get('version')}")
+                        if rejected_rows:
+                            st.warning(f"⚠️ {rejected_rows:,} record(s) have values outside the accepted "
+                                       "ranges and were not scored; the error column of the results says why.")
+                        st.download_button(label="📥 Download Scored Results", data=scored_bytes,
+                                           file_name=f"{batch_key}_scored.{file_format}",
+                                           mime="text/csv" if file_format == "csv" else "application/octet-stream")
+
+                        drift_report = drift_monitor.report()
+                        drifted = drift_report[drift_report["drifted"]]
+                        if drifted.empty:
+                            st.caption("📊 Feature distributions are in line with the training data.")
+                        else:
+                            st.warning(f"⚠️ {len(drifted)} feature(s) differ from the training data: "
+                                       + ", ".join(drifted.index))
+                        with st.expander("📊 Drift vs Training Data"):
+                            st.dataframe(drift_report.round(3))
+
+    # Load time and memory of every model loaded so far in this process
+    model_stats = model_registry.stats()
+    if model_stats:
+        with st.expander("⚙️ Loaded Models"):
+            st.caption("New model files in `Models/` are loaded, warmed up and swapped in without a restart.")
+            stats_df = pd.DataFrame(model_stats)
+            stats_df["load_ms"] = (stats_df.pop("load_seconds") * 1000).round(1)
+            stats_df["file_size_kb"] = (stats_df.pop("file_size_bytes") / 1024).round(1)
+            stats_df["memory_kb"] = (stats_df.pop("memory_bytes") / 1024).round(1)
+            stats_df["sha256"] = stats_df["sha256"].str[:12]
+            st.dataframe(stats_df, hide_index=True)
+
+    # Batching window tuning, shared by every session in this process
+    with st.expander("⏱️ Prediction Batching"):
+        if ADMIN:
+            tune_cols = st.columns(2)
+            max_wait_ms = tune_cols[0].number_input("Batch Window (ms)", min_value=0.0, max_value=100.0,
+                                                    value=float(prediction_scheduler.max_wait_ms), step=1.0)
+            max_batch_size = tune_cols[1].number_input("Max Batch Size", min_value=1, max_value=10000,
+                                                       value=int(prediction_scheduler.max_batch_size))
+            if (max_wait_ms, max_batch_size) != (prediction_scheduler.max_wait_ms, prediction_scheduler.max_batch_size):
+                prediction_scheduler.configure(max_wait_ms=max_wait_ms, max_batch_size=max_batch_size)
+        else:
+            st.caption(f"Batch window {prediction_scheduler.max_wait_ms:g} ms · "
+                       f"max batch size {prediction_scheduler.max_batch_size} "
+                       "(set `INFERENCE_BATCH_WAIT_MS` / `INFERENCE_MAX_BATCH_SIZE`)")
+
+        batch_stats = [(key, stats, "") for key, stats in prediction_scheduler.stats().items()]
+        explain_stats = prediction_scheduler.stats(explain=True)
+        batch_stats += [(key, stats, " · explained") for key, stats in explain_stats.items()]
+        for model_key, model_batch_stats, kind in batch_stats:
+            st.markdown(f"**{inference.DISEASES[model_key]['label']}{kind}**")
+            stat_cols = st.columns(4)
+            stat_cols[0].metric("Requests", model_batch_stats["requests"])
+            stat_cols[1].metric("Mean Batch Size", f"{model_batch_stats['mean_batch_size']:.1f}")
+            stat_cols[2].metric("p50 Latency", f"{model_batch_stats['latency_p50_ms']:.1f} ms")
+            stat_cols[3].metric("p99 Latency", f"{model_batch_stats['latency_p99_ms']:.1f} ms")
+            histogram = model_batch_stats["batch_size_histogram"]
+            if histogram:
+                st.bar_chart(pd.Series(histogram, name="Batches"))
+
+    # Repeated inputs (reruns, re-screenings) are answered from the shared prediction cache
+    if prediction_scheduler.cache is not None:
+        with st.expander("⚡ Prediction Cache"):
+            cache_stats = prediction_scheduler.cache.stats()
+            cache_cols = st.columns(4)
+            cache_cols[0].metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
+            cache_cols[1].metric("Hits / Misses", f"{cache_stats['hits'] + cache_stats['disk_hits']} / "
+                                                  f"{cache_stats['misses']}")
+            cache_cols[2].metric("Cached Results", cache_stats["entries"])
+            cache_cols[3].metric("Invalidations", cache_stats["invalidations"])
@@ -0,0 +1,136 @@
+import datetime
+
+import streamlit as st
+
+import charts
+from storage import FitnessStore
+
+
+EXERCISE_OPTIONS = ["Running", "Cycling", "Yoga", "Swimming", "Weight Lifting", "Jump Rope", "Dancing", "Custom"]
+CALORIES_PER_MINUTE = {
+    "Running": 10, "Cycling": 8, "Yoga": 4, "Swimming": 9, "Weight Lifting": 6,
+    "Jump Rope": 12, "Dancing": 7
+}
+# Longer ranges are downsampled to weekly, then monthly totals so the chart stays small
+MAX_CHART_POINTS = 400
+# The history table shows one page of workouts at a time instead of the whole log
+HISTORY_PAGE_SIZE = 50
+
+
+# Workout data lives in SQLite; the legacy CSV is imported once on first start
+@st.cache_resource
+def get_fitness_store():
+    store = FitnessStore()
+    store.migrate_csv("fitness_logs.csv")
+    return store
+
+
+def render(context):
+    chart_mode = context["chart_mode"]
+    st.title("💪 Fitness Tracking")
+    st.write("Log your daily workouts and track progress.")
+
+    fitness_store = get_fitness_store()
+    # (first, last) workout date from the daily rollup, None when nothing is logged
+    bounds = fitness_store.date_bounds()
+
+    # --- USER INPUT FORM ---
+    st.subheader("🏋️ Log Your Workout")
+    cols = st.columns(2)
+
+    # Exercise selection: dropdown with common exercises
+    exercise = cols[0].selectbox("Exercise Type", EXERCISE_OPTIONS)
+
+    # If "Custom" is selected, allow text input
+    if exercise == "Custom":
+        exercise = cols[0].text_input("Enter Custom Exercise", placeholder="E.g., Kickboxing, Pilates")
+
+    # Duration input
+    duration = cols[1].number_input("Duration (minutes)", min_value=1, step=5)
+
+    # Calories estimation (if not entered manually)
+    estimated_calories = duration * CALORIES_PER_MINUTE.get(exercise, 5)
+    calories = st.number_input("Calories Burned (Optional)", min_value=0, value=int(estimated_calories))
+
+    # Date input
+    date = st.date_input("Date", datetime.date.today())
+
+    # Log Workout Button
+    if st.button("📌 Log Workout"):
+        if exercise:  # Ensure exercise name is not empty
+            fitness_store.log(date, exercise, duration, calories)
+            st.success("✅ Workout logged successfully!")
+            st.rerun()
+        else:
+            st.warning("⚠️ Please enter the exercise type.")
+
+    # --- WORKOUT HISTORY ---
+    st.subheader("📊 Your Workout History")
+    if bounds is not None:
+        # The selected range limits both the table and the charts
+        first_day, last_day = bounds
+        date_range = st.date_input("📅 Date Range", (first_day, last_day), min_value=first_day,
+                                   max_value=max(last_day, datetime.date.today()), key="workout_range")
+        range_start, range_end = date_range if len(date_range) == 2 else (date_range[0], date_range[0])
+
+        # Only the visible page of the range is read from the workouts table
+        pages = max(-(-fitness_store.count(range_start, range_end) // HISTORY_PAGE_SIZE), 1)
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, key="workout_page")
+        st.dataframe(fitness_store.history(range_start, range_end, limit=HISTORY_PAGE_SIZE,
+                                           offset=(page - 1) * HISTORY_PAGE_SIZE))
+        st.caption(f"Page {page} of {pages}, newest first")
+
+        # Delete specific workouts
+        delete_cols = st.columns(2)
+        selected_date = delete_cols[0].date_input("📅 Select Date to Delete")
+        selected_exercise = delete_cols[1].text_input("🏋️ Enter Exercise to Delete")
+
+        if st.button("🗑️ Delete Workout"):
+            fitness_store.delete(selected_date, selected_exercise)
+            st.success("✅ Workout deleted successfully!")
+            st.rerun()
+
+        # Clear all history
+        if st.button("⚠️ Clear All Workout History"):
+            fitness_store.clear()
+            st.success("✅ All workout history cleared!")
+            st.rerun()
+
+        # --- WORKOUT VISUALIZATION ---
+        st.subheader("📈 Workout Trends")
+
+        # Charts read only the pre-aggregated rollups, never the raw workout rows
+        # Rolling totals for the current week and month
+        today = datetime.date.today()
+        week_totals = fitness_store.daily_totals(today - datetime.timedelta(days=today.weekday()), today)
+        month_totals = fitness_store.daily_totals(today.replace(day=1), today)
+        total_cols = st.columns(4)
+        total_cols[0].metric("🔥 Calories This Week", f"{week_totals['calories'].sum():,} kcal")
+        total_cols[1].metric("⏱️ Minutes This Week", f"{week_totals['minutes'].sum():,}")
+        total_cols[2].metric("🔥 Calories This Month", f"{month_totals['calories'].sum():,} kcal")
+        total_cols[3].metric("🏋️ Sessions This Month", f"{month_totals['sessions'].sum():,}")
+
+        # Downsample long ranges to keep the chart small
+        range_days = (range_end - range_start).days + 1
+        if range_days <= MAX_CHART_POINTS:
+            calories_data, resolution = fitness_store.daily_totals(range_start, range_end), "Daily"
+        elif range_days // 7 <= MAX_CHART_POINTS:
+            calories_data, resolution = fitness_store.period_totals(range_start, range_end, "W"), "Weekly"
+        else:
+            calories_data, resolution = fitness_store.period_totals(range_start, range_end, "M"), "Monthly"
+
+        # Calories burned over time
+        charts.line_chart("workout_calories", calories_data["calories"],
+                          f"🔥 Calories Burned Over Time ({resolution})", "Date", "Calories Burned",
+                          color="red", mode=chart_mode)
+
+        # Workout count per type
+        workout_counts = fitness_store.exercise_counts()
+        charts.bar_chart("workout_counts", workout_counts, "🏋️‍♂️ Most Frequent Workouts",
+                         "Exercise Type", "Count", palette="viridis", mode=chart_mode)
+
+        with st.expander("⏱️ Chart Render Times"):
+            st.dataframe(charts.render_stats(), hide_index=True)
+
+    else:
+        st.info("ℹ️ No workouts logged yet.")
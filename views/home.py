@@ -0,0 +1,37 @@
+import streamlit as st
+from streamlit_lottie import st_lottie
+
+from lottie_assets import ANIMATIONS, load_lottie
+
+
+def render(context):
+    # Display an animated banner
+    st.markdown("<h1 style='text-align: center; color: #4CAF50;'>🏥 Your Personal Health & Wellness Assistant</h1>",
+                unsafe_allow_html=True)
+
+    st.markdown(
+        "<h3 style='text-align: center; color: #AAAAAA; text-shadow: 2px 2px 10px rgba(0, 255, 0, 0.3);'>Empowering you with AI-driven health insights!</h3>",
+        unsafe_allow_html=True
+    )
+    # Served from memory / local assets after the first load; skipped if it can't be fetched
+    lottie_animation = load_lottie(ANIMATIONS["health"])
+    if lottie_animation is not None:
+        st_lottie(lottie_animation, height=300, key="health_animation")
+
+    # Brief description
+    st.write(
+        """
+        Welcome to your ultimate health companion! This app helps you:
+        - 🏋️ Track fitness progress
+        - 🍏 Get personalized diet recommendations
+        - 🏥 Predict and assess disease risks
+        - 💬 Interact with an AI-powered chatbot & voice assistant
+        - 📊 Receive AI-driven health insights and reports
+        """
+    )
+
+    # Footer message
+    st.markdown(
+        "<p style='text-align: center; color: #888;'>Your health, your future – take charge today! 💪</p>",
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,194 @@
+import datetime
+import os
+import re
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+import charts
+from storage import MoodStore
+
+
+MOOD_OPTIONS = ["😊 Happy", "😞 Sad", "😰 Stressed", "😟 Anxious", "😌 Relaxed"]
+
+# Mood styles for better UI
+MOOD_STYLES = {
+    "😊 Happy": "background-color:#FFD700; color:black; font-weight:bold; padding:8px; border-radius:10px;",
+    "😞 Sad": "background-color:#4682B4; color:white; font-weight:bold; padding:8px; border-radius:10px;",
+    "😰 Stressed": "background-color:#FF4500; color:white; font-weight:bold; padding:8px; border-radius:10px;",
+    "😟 Anxious": "background-color:#8B0000; color:white; font-weight:bold; padding:8px; border-radius:10px;",
+    "😌 Relaxed": "background-color:#32CD32; color:black; font-weight:bold; padding:8px; border-radius:10px;"
+}
+
+MOOD_TIPS = {
+    "😊 Happy": "✨ Keep doing what makes you happy! Share your positivity with others! 😊",
+    "😞 Sad": "🎵 Try listening to music, journaling your thoughts, or talking to a friend. 💙",
+    "😰 Stressed": "🧘 Take deep breaths, practice meditation, or do some light stretching.",
+    "😟 Anxious": "🌿 Try guided breathing exercises, mindfulness meditation, or a short walk.",
+    "😌 Relaxed": "🎶 Maintain your calm with gratitude journaling or soft music."
+}
+
+
+# The shared mood_logs.csv of the single-user app is imported under LEGACY_USER, and whoever
+# opens the page first can claim it into their own history
+LEGACY_USER = "default"
+# Anonymous histories are deleted this many days after their last visit
+ANONYMOUS_RETENTION_DAYS = int(os.environ.get("HEALTHAPP_ANONYMOUS_RETENTION_DAYS", 180))
+ANONYMOUS_PREFIXES = ("anon:", "session:")
+
+
+# Moods are stored per user in SQLite; expired anonymous histories are purged once per process
+@st.cache_resource
+def get_mood_store():
+    store = MoodStore()
+    store.migrate_csv("mood_logs.csv", user=LEGACY_USER)
+    store.purge_inactive(ANONYMOUS_PREFIXES, ANONYMOUS_RETENTION_DAYS)
+    return store
+
+
+def mood_user_id():
+    """Whose moods this session sees: the signed-in user, or the anonymous ID kept in the page URL."""
+    user = getattr(st, "user", None) or getattr(st, "experimental_user", None)
+    if user is not None and user.get("is_logged_in") and user.get("email"):
+        return f"user:{user.get('email')}"
+    # In the URL, a refresh or a bookmark comes back to the same history
+    anonymous_id = st.query_params.get("mood_id", "")
+    if not re.fullmatch(r"[0-9a-f]{32}", anonymous_id):
+        anonymous_id = uuid.uuid4().hex
+        st.query_params["mood_id"] = anonymous_id
+    return f"anon:{anonymous_id}"
+
+
+def render(context):
+    chart_mode = context["chart_mode"]
+
+    # --- PAGE TITLE ---
+    st.title("🧠 Mental Health Support")
+    st.write("Track your mood and get personalized relaxation tips.")
+
+    # --- MOOD TRACKING ---
+    mood_store = get_mood_store()
+    mood_user = mood_user_id()
+    if st.session_state.get("mood_seen") != mood_user:
+        mood_store.touch(mood_user)
+        st.session_state["mood_seen"] = mood_user
+    if mood_user.startswith("anon:"):
+        st.caption("👤 Your mood history is tied to this page's address: bookmark it to come back to it, or "
+                   f"sign in. Anonymous histories are deleted after {ANONYMOUS_RETENTION_DAYS} days without a visit.")
+
+    # The earlier shared mood log, until someone claims it
+    if mood_store.has_history(LEGACY_USER):
+        st.info("📥 A mood log from an earlier version of the app was found.")
+        if st.button("Add It to My History", key="claim_legacy_moods"):
+            st.success(f"✅ Added {mood_store.claim(LEGACY_USER, mood_user)} earlier mood entries")
+
+    # Load mood logs
+    mood_df = mood_store.history(mood_user)
+
+    st.write("### How do you feel today?")
+    cols = st.columns(5)
+
+    # Ensure session state exists for mood selection
+    if "selected_mood" not in st.session_state:
+        st.session_state["selected_mood"] = None
+
+    # Mood selection using buttons
+    for i, mood_option in enumerate(MOOD_OPTIONS):
+        if cols[i].button(mood_option, key=f"mood_{i}"):
+            st.session_state["selected_mood"] = mood_option
+
+    # Get the selected mood from session state
+    mood = st.session_state["selected_mood"]
+
+    # Display selected mood with styling
+    if mood:
+        st.markdown(
+            f'<div style="{MOOD_STYLES[mood]}; text-align:center;">{mood}</div>',
+            unsafe_allow_html=True
+        )
+
+    # Date input
+    date = st.date_input("Select Date", datetime.date.today())
+
+    # Log mood
+    if mood and st.button("Log Mood", key="log_mood"):
+        # The store's unique index rejects a mood already logged for this date
+        if mood_store.log(mood_user, date, mood):
+            mood_df = mood_store.history(mood_user)
+            st.success(f"✅ Mood logged successfully: {mood}")
+        else:
+            st.warning("⚠️ You've already logged this mood for today.")
+
+    # Bulk import of past moods
+    with st.expander("📥 Import Mood History"):
+        mood_upload = st.file_uploader("Upload a CSV with Date and Mood columns", type=["csv"], key="mood_import")
+        if mood_upload is not None and st.button("Import Moods", key="import_moods"):
+            try:
+                imported_count = mood_store.import_frame(mood_user, pd.read_csv(mood_upload))
+            except ValueError as e:
+                st.error(f"⚠️ {e}")
+            else:
+                st.success(f"✅ Imported {imported_count} mood entries")
+                mood_df = mood_store.history(mood_user)
+
+    # --- RELAXATION TIPS ---
+    st.subheader("💡 Relaxation Tips for You")
+
+    if mood:
+        st.markdown(f"""
+            <div style="border-radius: 12px; background: linear-gradient(135deg, #1e3c72, #2a5298); 
+                        padding: 15px; box-shadow: 3px 3px 12px rgba(0,0,0,0.2);">
+                <h3 style="color: #FFD700; text-align:center;">💡 Relaxation Tip</h3>
+                <p style="font-size: 18px; color: white; font-weight: bold; text-align:center;">{MOOD_TIPS[mood]}</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+    # --- MOOD TRACKER ---
+    st.subheader("📊 Your Mood Tracker")
+
+    if not mood_df.empty:
+        mood_df["Date"] = pd.to_datetime(mood_df["Date"])
+
+        # Show Data Table
+        with st.expander("📜 View Mood History"):
+            st.dataframe(mood_df.sort_values("Date", ascending=False))
+
+        # Button to Clear History
+        if st.button("🗑️ Clear Mood History", key="clear_history"):
+            mood_store.clear(mood_user)
+            st.success("✅ Mood history cleared successfully!")
+            st.rerun()
+
+        # The selected year applies to both charts below
+        current_year = datetime.datetime.today().year
+        mood_years = mood_store.years(mood_user)
+        year_options = sorted(set(mood_years) | {current_year}, reverse=True)
+        heatmap_year = st.selectbox("📅 Year", year_options, index=year_options.index(current_year),
+                                    key="mood_heatmap_year")
+
+        if heatmap_year in mood_years:
+            # Plot Mood Trends (Bar Chart) from the pre-aggregated monthly counts of that year
+            mood_counts = mood_store.mood_counts(mood_user, year=heatmap_year)
+
+            charts.bar_chart("mood_counts", mood_counts, f"Mood Frequency in {heatmap_year}", "Mood", "Count",
+                             palette=["#FFD700", "#4682B4", "#FF4500", "#8B0000", "#32CD32"], mode=chart_mode)
+
+            # --- CALENDAR HEATMAP ---
+            # Daily scores come from the rollup, so only the selected year is read
+            mood_data = mood_store.daily_scores(mood_user, heatmap_year)
+
+            # Month x Day grid; days that do not exist (e.g. Feb 30) stay 0
+            pivot_data = pd.DataFrame(0, index=pd.RangeIndex(1, 13, name="Month"),
+                                      columns=pd.RangeIndex(1, 32, name="Day"))
+            for day, score in mood_data.items():
+                pivot_data.at[day.month, day.day] = score
+
+            charts.calendar_heatmap("mood_heatmap", pivot_data, "Mood Calendar Heatmap", mode=chart_mode)
+        else:
+            st.warning("⚠️ No mood data available for this year.")
+
+        with st.expander("⏱️ Chart Render Times"):
+            st.dataframe(charts.render_stats(), hide_index=True)
+    else:
+        st.info("🚀 No mood logs recorded yet. Start tracking your mood today!")
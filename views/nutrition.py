@@ -0,0 +1,300 @@
+import streamlit as st
+
+
+# Page styles and meal plans are built once, when the page module is first imported
+PAGE_STYLE = """
+<style>
+    /* Global background with gradient */
+    .stApp {
+        background: linear-gradient(to bottom, #cce5ff, #99ccff, #66b2ff); /* Soft blue gradient */
+        background-size: cover;
+        background-position: center;
+        background-attachment: fixed;
+    }
+
+    /* Curved header */
+    .curved-section {
+        background: linear-gradient(90deg, #0073e6, #3399ff);
+        border-radius: 50% 50% 0 0;
+        padding: 30px;
+        text-align: center;
+        color: white;
+        font-size: 26px;
+        font-weight: bold;
+        box-shadow: 0px 4px 10px rgba(0,0,0,0.2);
+    }
+
+    /* Glassmorphism Effect for Cards */
+    .glass-card {
+        background: rgba(255, 255, 255, 0.2); /* Transparent white */
+        border-radius: 15px;
+        padding: 20px;
+        backdrop-filter: blur(10px);
+        box-shadow: 2px 2px 15px rgba(0,0,0,0.2);
+        margin: 10px 0;
+        text-align: center;
+        color: white;
+    }
+
+    .glass-card h4 {
+        color: #ffcc00;
+        font-size: 20px;
+        margin-bottom: 10px;
+    }
+
+    /* Nutrition section with better contrast */
+    .nutrition-section {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 12px;
+        padding: 15px;
+        text-align: center;
+        margin-top: 15px;
+        font-size: 16px;
+        color: white;
+    }
+
+    /* Styled Buttons */
+    .glow-btn {
+        display: block;
+        width: 100%;
+        padding: 12px;
+        font-size: 18px;
+        color: white;
+        background: linear-gradient(90deg, #ff7e5f, #feb47b);
+        border: none;
+        border-radius: 25px;
+        cursor: pointer;
+        text-align: center;
+        box-shadow: 0 0 10px rgba(255, 126, 95, 0.5);
+        transition: 0.3s;
+    }
+    .glow-btn:hover {
+        box-shadow: 0 0 20px rgba(255, 126, 95, 0.8);
+    }
+
+</style>
+"""
+
+# Meal Plan Data
+MEAL_PLANS = {
+    "Vegetarian": {
+        "Weight Loss": {
+            "Breakfast": "Poha with peanuts 🥜",
+            "Lunch": "Dal, roti, and sabzi 🥬",
+            "Dinner": "Khichdi with curd 🍚"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Paneer paratha with curd 🧀",
+            "Lunch": "Rajma chawal 🍛",
+            "Dinner": "Soya chunk curry with rice 🍚"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Sprouts chaat 🌱",
+            "Lunch": "Lauki dal and rice 🥘",
+            "Dinner": "Curd rice with jeera tadka 🍚"
+        },
+        "Boost Energy": {
+            "Breakfast": "Banana smoothie with almonds 🍌",
+            "Lunch": "Bhindi sabzi with dal and rice 🥒",
+            "Dinner": "Mixed veg curry with chapati 🥗"
+        },
+        "General Well-being": {
+            "Breakfast": "Moong dal chilla 🌮",
+            "Lunch": "Baingan bharta with jowar roti 🍆",
+            "Dinner": "Palak paneer with paratha 🥘"
+        }
+    },
+    "Vegan": {
+        "Weight Loss": {
+            "Breakfast": "Ragi porridge with nuts 🌰",
+            "Lunch": "Chana masala with brown rice 🍛",
+            "Dinner": "Mixed vegetable dalia 🥣"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Peanut butter toast 🥜",
+            "Lunch": "Masoor dal and quinoa 🍚",
+            "Dinner": "Soya chunk pulao 🍲"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Papaya with flaxseeds 🍈",
+            "Lunch": "Ridge gourd sabzi with rice 🥗",
+            "Dinner": "Methi thepla with curd 🌿"
+        },
+        "Boost Energy": {
+            "Breakfast": "Coconut water with chia seeds 🥥",
+            "Lunch": "Rajgira roti with sabzi 🥬",
+            "Dinner": "Sweet potato tikki with salad 🥔"
+        },
+        "General Well-being": {
+            "Breakfast": "Bajra roti with jaggery 🌾",
+            "Lunch": "Dal baati 🥘",
+            "Dinner": "Tofu bhurji with paratha 🍽"
+        }
+    },
+    "Keto": {
+        "Weight Loss": {
+            "Breakfast": "Paneer bhurji with butter 🧈",
+            "Lunch": "Egg curry with spinach 🍳",
+            "Dinner": "Grilled fish with ghee sautéed veggies 🐟"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Cheese omelet with avocado 🥑",
+            "Lunch": "Butter chicken with salad 🍗",
+            "Dinner": "Fish tikka with mint chutney 🐠"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Coconut flour dosa 🥥",
+            "Lunch": "Bhindi stir-fry with paneer 🍛",
+            "Dinner": "Mushroom masala with raita 🍄"
+        },
+        "Boost Energy":{
+            "Breakfast": "Bulletproof coffee ☕",
+            "Lunch": "Palak chicken with ghee rice 🥘",
+            "Dinner": "Lamb kebabs with cucumber salad 🍢"
+        },
+        "General Well-being": {
+            "Breakfast": "Almond flour pancakes 🥞",
+            "Lunch": "Cauliflower rice biryani 🍛",
+            "Dinner": "Tandoori fish with sautéed greens 🐟"
+        }
+    },
+    "High-Protein": {
+        "Weight Loss": {
+            "Breakfast": "Besan chilla with mint chutney 🥞",
+            "Lunch": "Sprouted moong dal salad 🥗",
+            "Dinner": "Grilled tofu and veggies 🍢"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Boiled eggs with almonds 🥚",
+            "Lunch": "Mutton curry with rice 🍖",
+            "Dinner": "Paneer tikka with whole wheat roti 🧀"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Buttermilk with jeera powder 🥤",
+            "Lunch": "Oats khichdi with dal 🥘",
+            "Dinner": "Spinach soup with grilled paneer 🍲"
+        },
+        "Boost Energy": {
+            "Breakfast": "Chickpea pancakes with chutney 🌮",
+            "Lunch": "Fish curry with brown rice 🐠",
+            "Dinner": "Dal makhani with roti 🥘"
+        },
+        "General Well-being": {
+            "Breakfast": "Masala oats with nuts 🌰",
+            "Lunch": "Egg curry with chapati 🍛",
+            "Dinner": "Soya chunks and vegetable stir-fry 🍲"
+        }
+    },
+    "Low-Carb": {
+        "Weight Loss": {
+            "Breakfast": "Boiled eggs with green tea 🍵",
+            "Lunch": "Paneer salad with olive oil 🧀",
+            "Dinner": "Grilled fish with steamed veggies 🐟"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Scrambled eggs with cheese 🧀",
+            "Lunch": "Chicken tikka with green chutney 🍗",
+            "Dinner": "Grilled prawns with spinach 🦐"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Herbal tea with nuts 🍵",
+            "Lunch": "Pumpkin soup with grilled paneer 🍲",
+            "Dinner": "Steamed veggies with lemon dressing 🥗"
+        },
+        "Boost Energy": {
+            "Breakfast": "Avocado smoothie with seeds 🥑",
+            "Lunch": "Eggplant bharta with curd 🍆",
+            "Dinner": "Mutton kebabs with cucumber salad 🍖"
+        },
+        "General Well-being": {
+            "Breakfast": "Greek yogurt with berries 🍓",
+            "Lunch": "Grilled chicken with mushrooms 🍄",
+            "Dinner": "Fish curry with sautéed spinach 🥘"
+        }
+    },
+    "Balanced Diet": {
+        "Weight Loss": {
+            "Breakfast": "Upma with vegetables 🍛",
+            "Lunch": "Dal tadka with roti 🥘",
+            "Dinner": "Vegetable pulao with raita 🍚"
+        },
+        "Muscle Gain": {
+            "Breakfast": "Egg paratha with curd 🥚",
+            "Lunch": "Chicken biryani with cucumber raita 🍛",
+            "Dinner": "Rajma with brown rice 🍲"
+        },
+        "Improve Digestion": {
+            "Breakfast": "Banana with soaked almonds 🍌",
+            "Lunch": "Dhokla with mint chutney 🥮",
+            "Dinner": "Curd rice with coriander tadka 🍚"
+        },
+        "Boost Energy": {
+            "Breakfast": "Dry fruit laddoo with milk 🥛",
+            "Lunch": "Masala dal with ghee chapati 🥘",
+            "Dinner": "Fish fry with sautéed veggies 🐠"
+        },
+        "General Well-being": {
+            "Breakfast": "Idli with sambar 🥥",
+            "Lunch": "Mixed dal khichdi 🥘",
+            "Dinner": "Methi roti with aloo sabzi 🥔"
+        }
+    }
+}
+
+
+def render(context):
+    st.markdown(PAGE_STYLE, unsafe_allow_html=True)
+
+    # Curved Section for Intro
+    st.markdown('<div class="curved-section">🥗 Personalized Indian Nutrition Guidance</div>', unsafe_allow_html=True)
+
+    # Nutrition Guidance Info
+    st.markdown(
+        "<p style='text-align: center; font-size: 18px;'>Get meal suggestions tailored to your health goals.</p>",
+        unsafe_allow_html=True)
+
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        dietary_preference = st.selectbox("Select Your Dietary Preference:",
+                                          ["Vegetarian", "Vegan", "Keto", "High-Protein", "Low-Carb", "Balanced Diet"])
+    with col2:
+        health_goal = st.selectbox("Select Your Health Goal:",
+                                   ["Weight Loss", "Muscle Gain", "Improve Digestion", "Boost Energy",
+                                    "General Well-being"])
+
+    # Button to Generate Meal Plan
+    if st.button("✨ Get My Meal Plan", key="meal_plan"):
+        if dietary_preference in MEAL_PLANS and health_goal in MEAL_PLANS[dietary_preference]:
+            st.success(f"🍽 Your {dietary_preference} Meal Plan for {health_goal}")
+            meals = MEAL_PLANS[dietary_preference][health_goal]
+
+            # Display meals in styled cards
+            if meals and isinstance(meals, dict):
+                for meal_time, meal_name in meals.items():
+                    with st.container():
+                        st.markdown(f"""
+                                        <div class="glass-card">
+                                            <h4>{meal_time}</h4>
+                                            <p>{meal_name}</p>
+                                        </div>
+                                    """, unsafe_allow_html=True)
+                        st.write("")
+        else:
+            st.warning("Sorry, no meal plan found. Try another combination.")
+
+    st.markdown("""
+                                <div class="nutrition-section">
+                                    <h4>📊 Nutrition Facts</h4>
+                                    Your meal plan is balanced with macros and micronutrients, ensuring good health.
+                                </div>
+                            """, unsafe_allow_html=True)
+
+
+    if dietary_preference in MEAL_PLANS and health_goal in MEAL_PLANS[dietary_preference]:
+        meal_text = f"Meal Plan for {dietary_preference} - {health_goal}\n\n"
+        for meal_time, meal_name in MEAL_PLANS[dietary_preference][health_goal].items():
+            meal_text += f"{meal_time}: {meal_name}\n"
+
+        st.download_button(label="📥 Download Your Meal Plan", data=meal_text, file_name="meal_plan.txt",
+                           mime="text/plain", help="Click to download your personalized meal plan.")